@@ -0,0 +1,199 @@
+"""
+Running season aggregates that absorb one NFL week at a time.
+
+apply_week(week_picks, week_results) folds a week's picks rows and
+scores_and_picks rows into the persisted aggregates (weekly correct-pick
+totals, player x team pick counts, favorite-pick numerators/denominators and
+the best/worst 3-week windows), so the cost of an update depends only on the
+new week. Applying the latest week again replaces it, so a week can be folded
+in before all its results are final. The stats read back from
+SeasonAggregates are identical to data_prep's full recompute over the season
+so far.
+Run: python aggregates.py WEEK   (folds WEEK from the input CSVs; builds weeks < WEEK first if
+     there are no saved aggregates)
+"""
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from data_prep import INPUT_FILES, PLAYERS, format_streaks, pick_facts
+
+AGGREGATES_PATH = Path("aggregates.pkl")
+STREAK_WEEKS = 3
+
+
+class SeasonAggregates:
+    """Season-to-date aggregates, updated with apply_week in week order."""
+
+    def __init__(self, players=None):
+        self.players = list(players or PLAYERS)
+        self.weeks = []              # weeks with results, in order
+        self.cumulative = []         # running correct-pick totals, one array per week
+        self.recent = []             # last STREAK_WEEKS - 1 weekly totals
+        self.best = self.worst = None  # (totals, start week, end week) of the best/worst window
+        self.pick_counts = {}        # player -> {team: picks}
+        self.fav = {}                # player -> [favorite picks, picks with a result]
+        self.last_week = None
+        self._undo = None            # last_week's contributions, subtracted when it's re-applied
+
+    @classmethod
+    def from_season(cls, picks, sap, players=None):
+        """Aggregates for a whole season, built one week at a time."""
+        aggregates = cls(players)
+        for week in sorted(set(picks["week"]) | set(sap["week"])):
+            aggregates.apply_week(picks[picks["week"] == week], sap[sap["week"] == week])
+        return aggregates
+
+    def apply_week(self, week_picks, week_results):
+        """Fold one week's picks rows and scores_and_picks rows in.
+
+        Applying last_week again replaces its earlier version (e.g. once the
+        rest of its results are in).
+        """
+        weeks = set(week_picks["week"]) | set(week_results["week"])
+        if len(weeks) != 1:
+            raise ValueError(f"apply_week takes exactly one week, got {sorted(weeks)}")
+        week = weeks.pop()
+        if week == self.last_week and getattr(self, "_undo", None) is not None:
+            self._undo_last_week()
+        elif self.last_week is not None and week <= self.last_week:
+            raise ValueError(f"week {week} is before week {self.last_week}; "
+                             f"rebuild with SeasonAggregates.from_season")
+
+        counts = week_picks.groupby(["player", "pick"]).size()
+        facts = pick_facts(week_picks, week_results)
+        facts = facts[facts["in_sap"]]
+        fav = facts.groupby("player")["picked_fav"].agg(["sum", "count"])
+        # everything this week adds, plus the streak state it replaces (all O(players x teams))
+        self._undo = {"last_week": self.last_week, "results": bool(len(week_results)),
+                      "streaks": (list(self.recent), self.best, self.worst),
+                      "counts": counts, "fav": fav}
+        self.last_week = week
+
+        if len(week_results):
+            totals = week_results[self.players].sum().to_numpy()
+            previous = self.cumulative[-1] if self.cumulative else 0
+            self.weeks.append(week)
+            self.cumulative.append(previous + totals)
+            self._update_streaks(week, totals)
+
+        for (player, team), n in counts.items():
+            player_counts = self.pick_counts.setdefault(player, {})
+            player_counts[team] = player_counts.get(team, 0) + n
+
+        for player, (fav_picks, total) in fav.iterrows():
+            running = self.fav.setdefault(player, [0, 0])
+            running[0] += fav_picks
+            running[1] += total
+
+    def _undo_last_week(self):
+        undo = self._undo
+        self.last_week = undo["last_week"]
+        if undo["results"]:
+            self.weeks.pop()
+            self.cumulative.pop()
+        self.recent, self.best, self.worst = undo["streaks"]
+        # drop entries the week created, so stats don't grow zero rows/columns
+        for (player, team), n in undo["counts"].items():
+            player_counts = self.pick_counts[player]
+            player_counts[team] -= n
+            if not player_counts[team]:
+                del player_counts[team]
+            if not player_counts:
+                del self.pick_counts[player]
+        for player, (fav_picks, total) in undo["fav"].iterrows():
+            running = self.fav[player]
+            running[0] -= fav_picks
+            running[1] -= total
+            if not running[1]:
+                del self.fav[player]
+        self._undo = None
+
+    def _update_streaks(self, week, totals):
+        self.recent.append((week, totals))
+        if len(self.recent) < STREAK_WEEKS:
+            return
+        start = self.recent[0][0]
+        window = sum(t for _, t in self.recent)
+        self.recent.pop(0)
+        if self.best is None:
+            self.best = (window, np.full(len(window), start), np.full(len(window), week))
+            self.worst = (window, np.full(len(window), start), np.full(len(window), week))
+            return
+        # strict comparisons keep the earliest window on ties, like the full recompute
+        for attr, better in (("best", window > self.best[0]), ("worst", window < self.worst[0])):
+            sums, starts, ends = getattr(self, attr)
+            setattr(self, attr, (np.where(better, window, sums), np.where(better, start, starts),
+                                 np.where(better, week, ends)))
+
+    # ── stats, same output as the data_prep functions ─────────────────────
+
+    def weekly_cumulative(self):
+        values = np.vstack(self.cumulative) if self.cumulative else np.zeros((0, len(self.players)))
+        return pd.DataFrame(values, index=pd.Index(self.weeks, name="week"), columns=self.players)
+
+    def _count_table(self):
+        ct = pd.DataFrame.from_dict(self.pick_counts, orient="index").fillna(0).astype("int64")
+        ct = ct.sort_index().sort_index(axis=1)
+        ct.index.name, ct.columns.name = "player", "pick"
+        return ct
+
+    def paa_heatmap(self):
+        ct = self._count_table()
+        return ct.sub(ct.mean(axis=0))
+
+    def most_picked_teams(self):
+        totals = self._count_table().sum(axis=0)
+        return totals.reset_index(name="total_picks").sort_values("total_picks", ascending=False)
+
+    def player_fav_underdog_rate(self):
+        players = sorted(self.fav)
+        fav, total = np.array([self.fav[p] for p in players], dtype="int64").reshape(-1, 2).T
+        rates = pd.DataFrame({"player": players, "fav_rate": fav / total, "total": total})
+        return rates.sort_values("fav_rate", ascending=False)
+
+    def hot_cold_streaks(self):
+        if self.best is None:
+            return format_streaks([])
+        return format_streaks(zip(self.players, self.best[1], self.best[2], self.best[0],
+                                  self.worst[1], self.worst[2], self.worst[0]))
+
+    def save(self, path=AGGREGATES_PATH):
+        with open(path, "wb") as f:
+            pickle.dump(self, f)
+
+    @staticmethod
+    def load(path=AGGREGATES_PATH, players=None):
+        """Saved aggregates, or empty ones if nothing has been saved yet."""
+        if not Path(path).exists():
+            return SeasonAggregates(players)
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+
+def apply_week(week_picks, week_results, path=AGGREGATES_PATH):
+    """Fold one week into the aggregates saved at `path` and save them again."""
+    aggregates = SeasonAggregates.load(path)
+    aggregates.apply_week(week_picks, week_results)
+    aggregates.save(path)
+    return aggregates
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Fold one week of picks/results into the season aggregates.")
+    parser.add_argument("week", type=int)
+    parser.add_argument("--path", default=AGGREGATES_PATH, help="saved aggregates")
+    args = parser.parse_args()
+
+    sap = pd.read_csv(INPUT_FILES["sap"])
+    picks = pd.read_csv(INPUT_FILES["picks"])
+    if not Path(args.path).exists():
+        print(f"No aggregates at {args.path}; building weeks before {args.week} from the CSVs")
+        SeasonAggregates.from_season(picks[picks["week"] < args.week], sap[sap["week"] < args.week]).save(args.path)
+    aggregates = apply_week(picks[picks["week"] == args.week], sap[sap["week"] == args.week], args.path)
+    first = aggregates.weeks[0] if aggregates.weeks else args.week
+    print(f"Applied week {args.week}; aggregates cover weeks {first}-{aggregates.last_week}")
@@ -3,23 +3,34 @@ RYP Season Dashboard — Interactive NFL Picks Analysis
 Run: streamlit run app.py
 """
 import streamlit as st
+from streamlit.errors import StreamlitAPIException
 import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
+import json
 import random
 import pickle
 
-from ml_model import ALL_TEAMS, predict_pick, load_models
+from ml_model import ALL_TEAMS, LOOKUP_PATH, PickLookup, get_encoder, predict_pick, load_models
 from data_prep import PLAYERS
+from cache_store import CACHE_DIR, CacheStore
+import profiling
+from profiling import section
+
+CACHE_MANIFEST = CACHE_DIR / "manifest.json"
+STALE_CACHE_NOTE = "{section} needs a newer cache: run `python data_prep.py` to rebuild cache/."
 
 st.set_page_config(page_title="RYP 2025-2026 Season Wrapped", layout="wide")
 st.title("RYP 2025-2026 Season Wrapped")
 
 # ── Load precomputed data (instant) ─────────────────────────────────────────
 
-@st.cache_data
-def get_cache():
+@st.cache_resource(max_entries=1)
+def get_cache(stamp):
+    # per-key store from data_prep.build_cache; older deployments only ship cache.pkl
+    if CacheStore.exists():
+        return CacheStore()
     with open("cache.pkl", "rb") as f:
         return pickle.load(f)
 
@@ -27,13 +38,206 @@ def get_cache():
 def get_models():
     return load_models()
 
-c = get_cache()
+@st.cache_resource
+def get_lookup():
+    # optional precompute from `python ml_model.py --lookup`; ignored if stale
+    if not LOOKUP_PATH.exists():
+        return None
+    lookup = PickLookup()
+    return lookup if lookup.matches(models, feature_names) else None
+
+c = get_cache(CACHE_MANIFEST.stat().st_mtime_ns if CacheStore.exists() else 0)
 models, feature_names = get_models()
+lookup = get_lookup()
 
 # conference lookup for scenario generation
 team_meta = c["teams_df"][["team_id", "team_conference", "team_division"]].dropna(subset=["team_division"]).drop_duplicates(subset=["team_id"])
 conf_map = team_meta.set_index("team_id")["team_conference"].to_dict()
 
+# ── Static figures ──────────────────────────────────────────────────────────
+# Built once per cache version and shared across reruns and sessions.
+
+cache_version = json.dumps(c.get("_meta", {}).get("hashes", {}), sort_keys=True)
+
+@st.cache_resource
+def ml_figure(version, _ml):
+    fig_ml = px.bar(
+        _ml, y="team", x="ml_pct", orientation="h",
+        color="ml_pct", color_continuous_scale="RdYlGn",
+        labels={"ml_pct": "Win %", "team": ""},
+        text="wins_label",
+    )
+    fig_ml.add_vline(x=0.5, line_dash="dash", line_color="gray")
+    fig_ml.update_traces(textposition="outside")
+    fig_ml.update_layout(
+        height=700,
+        yaxis=dict(autorange="reversed"),
+        coloraxis_showscale=False,
+        xaxis=dict(tickformat=".0%"),
+        margin=dict(t=10),
+    )
+    return fig_ml
+
+@st.cache_resource
+def ats_figure(version, _ats):
+    fig_ats = px.bar(
+        _ats, y="team", x="ats_pct", orientation="h",
+        color="ats_pct", color_continuous_scale="RdYlGn",
+        labels={"ats_pct": "ATS Win %", "team": ""},
+        hover_data={"ats_wins": True, "ats_losses": True, "ats_pushes": True, "covers_label": False},
+        text="covers_label",
+    )
+    fig_ats.add_vline(x=0.5, line_dash="dash", line_color="gray")
+    fig_ats.update_traces(textposition="outside")
+    fig_ats.update_layout(
+        height=700,
+        yaxis=dict(autorange="reversed"),
+        coloraxis_showscale=False,
+        xaxis=dict(tickformat=".0%"),
+        margin=dict(t=10),
+    )
+    return fig_ats
+
+@st.cache_resource
+def home_away_figure(version, _ha):
+    fig_ha = go.Figure()
+    fig_ha.add_trace(go.Bar(
+        name="Home", y=_ha["team"], x=_ha["home_cover_pct"],
+        orientation="h", marker_color="#636EFA",
+    ))
+    fig_ha.add_trace(go.Bar(
+        name="Away", y=_ha["team"], x=_ha["away_cover_pct"],
+        orientation="h", marker_color="#EF553B",
+    ))
+    fig_ha.add_vline(x=0.5, line_dash="dash", line_color="gray")
+    fig_ha.update_layout(
+        barmode="group", xaxis_title="Cover Rate", height=700,
+        xaxis=dict(tickformat=".0%"),
+        margin=dict(t=10),
+    )
+    return fig_ha
+
+@st.cache_resource
+def spread_impact_figure(version, _si):
+    fig_si = px.bar(
+        _si, x="spread_bucket", y="fav_cover_rate",
+        text="games",
+        labels={"fav_cover_rate": "Favorite Cover Rate", "spread_bucket": "Spread Range"},
+        color="fav_cover_rate", color_continuous_scale="RdYlGn",
+    )
+    fig_si.add_hline(y=0.5, line_dash="dash", line_color="gray")
+    fig_si.update_layout(
+        height=450, coloraxis_showscale=False,
+        yaxis=dict(tickformat=".0%"),
+        margin=dict(t=10),
+    )
+    return fig_si
+
+@st.cache_resource
+def weekly_surprise_figure(version, _ws):
+    fig_ws = px.bar(
+        _ws, x="week", y="fav_cover_rate",
+        labels={"fav_cover_rate": "Favorite Cover Rate", "week": "Week"},
+        color="fav_cover_rate", color_continuous_scale="RdYlGn",
+        text="label",
+    )
+    fig_ws.add_hline(y=0.5, line_dash="dash", line_color="gray")
+    fig_ws.update_layout(
+        coloraxis_showscale=False,
+        yaxis=dict(tickformat=".0%"),
+        margin=dict(t=10),
+    )
+    return fig_ws
+
+@st.cache_resource
+def most_picked_figure(version, _mpt):
+    fig_mpt = px.bar(
+        _mpt, x="pick", y="total_picks",
+        labels={"pick": "Team", "total_picks": "Times Picked"},
+        color="total_picks", color_continuous_scale="Blues",
+    )
+    fig_mpt.update_layout(coloraxis_showscale=False, margin=dict(t=10))
+    return fig_mpt
+
+@st.cache_resource
+def favorite_rate_figure(version, _fur):
+    fig_fur = px.bar(
+        _fur, y="player", x="fav_rate", orientation="h",
+        labels={"fav_rate": "% Picking Favorite", "player": ""},
+        color="fav_rate", color_continuous_scale="Oranges",
+    )
+    fig_fur.add_vline(x=0.5, line_dash="dash", line_color="gray")
+    fig_fur.update_layout(
+        height=500, yaxis=dict(autorange="reversed"),
+        coloraxis_showscale=False, margin=dict(t=10),
+    )
+    fig_fur.update_xaxes(tickformat=".0%")
+    return fig_fur
+
+@st.cache_resource
+def herd_figure(version, _hm):
+    fig_hm = px.bar(
+        _hm, y="player", x="herd_rate", orientation="h",
+        labels={"herd_rate": "% With Majority", "player": ""},
+        color="herd_rate", color_continuous_scale="Purples",
+    )
+    fig_hm.update_layout(
+        height=500, yaxis=dict(autorange="reversed"),
+        coloraxis_showscale=False, margin=dict(t=10),
+    )
+    fig_hm.update_xaxes(tickformat=".0%")
+    return fig_hm
+
+@st.cache_resource
+def paa_figure(version, _paa):
+    fig_paa = px.imshow(
+        _paa.values, x=_paa.columns.tolist(), y=_paa.index.tolist(),
+        color_continuous_scale="RdYlGn", aspect="auto",
+        labels=dict(color="PAA"),
+    )
+    fig_paa.update_layout(height=500)
+    return fig_paa
+
+@st.cache_resource
+def leaderboard_figure(version, _wc, top5_players):
+    fig_wc = go.Figure()
+    for p in PLAYERS:
+        if p in _wc.columns:
+            visible = True if p in top5_players else "legendonly"
+            fig_wc.add_trace(go.Scatter(x=_wc.index, y=_wc[p], mode="lines+markers", name=p, visible=visible))
+    fig_wc.update_layout(
+        xaxis_title="Week", yaxis_title="Cumulative Correct Picks",
+        height=500, margin=dict(t=10),
+    )
+    return fig_wc
+
+@st.cache_resource
+def rolling_figure(version, _rolling_avg, top5_players):
+    fig_rolling = go.Figure()
+    for p in PLAYERS:
+        if p in _rolling_avg.columns:
+            visible = True if p in top5_players else "legendonly"
+            fig_rolling.add_trace(go.Scatter(
+                x=_rolling_avg.index, y=_rolling_avg[p], mode="lines", name=p, visible=visible,
+            ))
+    fig_rolling.update_layout(
+        xaxis_title="Week", yaxis_title="Avg Correct Picks (3-Week Rolling)",
+        height=500, margin=dict(t=10),
+    )
+    return fig_rolling
+
+@st.cache_resource
+def contrarian_figure(version, _contrarian_df):
+    fig_con = px.bar(
+        _contrarian_df.head(13), y="player", x="contrarian_rate", orientation="h",
+        color="contrarian_win_rate",
+        color_continuous_scale="RdYlGn",
+        labels={"contrarian_rate": "Contrarian Rate", "contrarian_win_rate": "Win Rate When Contrarian", "player": ""},
+    )
+    fig_con.update_layout(height=450, yaxis=dict(autorange="reversed"), margin=dict(t=10))
+    fig_con.update_xaxes(tickformat=".0%")
+    return fig_con
+
 # ── Tabs ─────────────────────────────────────────────────────────────────────
 
 tab0, tab1, tab2, tab3 = st.tabs([
@@ -46,7 +250,7 @@ tab0, tab1, tab2, tab3 = st.tabs([
 # ═══════════════════════════════════════════════════════════════════════════════
 # TAB 0: SUMMARY
 # ═══════════════════════════════════════════════════════════════════════════════
-with tab0:
+with tab0, section("app.tab0"):
     st.header("Season Summary")
 
     summary_text_col, summary_img_col = st.columns([2, 1])
@@ -131,7 +335,7 @@ with tab0:
 # ═══════════════════════════════════════════════════════════════════════════════
 # TAB 1: TEAM PERFORMANCE
 # ═══════════════════════════════════════════════════════════════════════════════
-with tab1:
+with tab1, section("app.tab1"):
     st.header("Team Performance")
     st.caption("How did NFL teams perform this season?")
 
@@ -155,22 +359,7 @@ with tab1:
             f"Their defense also recorded 0 interceptions, which has literally never happened before in NFL history."
         )
     with chart_col:
-        fig_ml = px.bar(
-            ml, y="team", x="ml_pct", orientation="h",
-            color="ml_pct", color_continuous_scale="RdYlGn",
-            labels={"ml_pct": "Win %", "team": ""},
-            text="wins_label",
-        )
-        fig_ml.add_vline(x=0.5, line_dash="dash", line_color="gray")
-        fig_ml.update_traces(textposition="outside")
-        fig_ml.update_layout(
-            height=700,
-            yaxis=dict(autorange="reversed"),
-            coloraxis_showscale=False,
-            xaxis=dict(tickformat=".0%"),
-            margin=dict(t=10),
-        )
-        st.plotly_chart(fig_ml, use_container_width=True)
+        st.plotly_chart(ml_figure(cache_version, ml), use_container_width=True)
 
     # ── ATS Record by Team ──────────────────────────────────────────────────
     ats = c["ats"].copy()
@@ -194,23 +383,7 @@ with tab1:
             f"And also remember when Baker was the MVP front runner around Week 7 or so?"
         )
     with chart_col:
-        fig_ats = px.bar(
-            ats, y="team", x="ats_pct", orientation="h",
-            color="ats_pct", color_continuous_scale="RdYlGn",
-            labels={"ats_pct": "ATS Win %", "team": ""},
-            hover_data={"ats_wins": True, "ats_losses": True, "ats_pushes": True, "covers_label": False},
-            text="covers_label",
-        )
-        fig_ats.add_vline(x=0.5, line_dash="dash", line_color="gray")
-        fig_ats.update_traces(textposition="outside")
-        fig_ats.update_layout(
-            height=700,
-            yaxis=dict(autorange="reversed"),
-            coloraxis_showscale=False,
-            xaxis=dict(tickformat=".0%"),
-            margin=dict(t=10),
-        )
-        st.plotly_chart(fig_ats, use_container_width=True)
+        st.plotly_chart(ats_figure(cache_version, ats), use_container_width=True)
 
     # ── Home vs Away ATS Cover Rate ─────────────────────────────────────────
     ha = c["ha"].sort_values("home_cover_pct", ascending=False)
@@ -229,22 +402,7 @@ with tab1:
             f"Jacksonville had them all beat. Must be the jacuzzi in Section 209."
         )
     with chart_col:
-        fig_ha = go.Figure()
-        fig_ha.add_trace(go.Bar(
-            name="Home", y=ha["team"], x=ha["home_cover_pct"],
-            orientation="h", marker_color="#636EFA",
-        ))
-        fig_ha.add_trace(go.Bar(
-            name="Away", y=ha["team"], x=ha["away_cover_pct"],
-            orientation="h", marker_color="#EF553B",
-        ))
-        fig_ha.add_vline(x=0.5, line_dash="dash", line_color="gray")
-        fig_ha.update_layout(
-            barmode="group", xaxis_title="Cover Rate", height=700,
-            xaxis=dict(tickformat=".0%"),
-            margin=dict(t=10),
-        )
-        st.plotly_chart(fig_ha, use_container_width=True)
+        st.plotly_chart(home_away_figure(cache_version, ha), use_container_width=True)
 
     # ── Spread Impact on Favorites ──────────────────────────────────────────
     si = c["si"]
@@ -260,19 +418,7 @@ with tab1:
             f"The number inside each bar is the sample size (total games in that bucket)."
         )
     with chart_col:
-        fig_si = px.bar(
-            si, x="spread_bucket", y="fav_cover_rate",
-            text="games",
-            labels={"fav_cover_rate": "Favorite Cover Rate", "spread_bucket": "Spread Range"},
-            color="fav_cover_rate", color_continuous_scale="RdYlGn",
-        )
-        fig_si.add_hline(y=0.5, line_dash="dash", line_color="gray")
-        fig_si.update_layout(
-            height=450, coloraxis_showscale=False,
-            yaxis=dict(tickformat=".0%"),
-            margin=dict(t=10),
-        )
-        st.plotly_chart(fig_si, use_container_width=True)
+        st.plotly_chart(spread_impact_figure(cache_version, si), use_container_width=True)
 
     # ── Favorites Coverage by Week ──────────────────────────────────────────
     ws = c["ws"].copy()
@@ -294,24 +440,12 @@ with tab1:
             f"({int(worst_wk['fav_covered'])}/{int(worst_wk['games'])})."
         )
     with chart_col:
-        fig_ws = px.bar(
-            ws, x="week", y="fav_cover_rate",
-            labels={"fav_cover_rate": "Favorite Cover Rate", "week": "Week"},
-            color="fav_cover_rate", color_continuous_scale="RdYlGn",
-            text="label",
-        )
-        fig_ws.add_hline(y=0.5, line_dash="dash", line_color="gray")
-        fig_ws.update_layout(
-            coloraxis_showscale=False,
-            yaxis=dict(tickformat=".0%"),
-            margin=dict(t=10),
-        )
-        st.plotly_chart(fig_ws, use_container_width=True)
+        st.plotly_chart(weekly_surprise_figure(cache_version, ws), use_container_width=True)
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # TAB 2: BIAS & PATTERNS
 # ═══════════════════════════════════════════════════════════════════════════════
-with tab2:
+with tab2, section("app.tab2"):
     st.header("Bias & Patterns")
     st.caption("This is where things get interesting: our group and individual tendencies revealed.")
 
@@ -364,13 +498,7 @@ with tab2:
             f"I'm still trying to wrap my head around how we collectively picked the worst performing team the most this season."
         )
     with chart_col:
-        fig_mpt = px.bar(
-            mpt, x="pick", y="total_picks",
-            labels={"pick": "Team", "total_picks": "Times Picked"},
-            color="total_picks", color_continuous_scale="Blues",
-        )
-        fig_mpt.update_layout(coloraxis_showscale=False, margin=dict(t=10))
-        st.plotly_chart(fig_mpt, use_container_width=True)
+        st.plotly_chart(most_picked_figure(cache_version, mpt), use_container_width=True)
 
     # ── Favorite Pick Rate ──────────────────────────────────────────────────
     fur = c["fur"]
@@ -391,18 +519,7 @@ with tab2:
             f"P-Otys should now be referred to as P-Chaos."
         )
     with chart_col:
-        fig_fur = px.bar(
-            fur, y="player", x="fav_rate", orientation="h",
-            labels={"fav_rate": "% Picking Favorite", "player": ""},
-            color="fav_rate", color_continuous_scale="Oranges",
-        )
-        fig_fur.add_vline(x=0.5, line_dash="dash", line_color="gray")
-        fig_fur.update_layout(
-            height=500, yaxis=dict(autorange="reversed"),
-            coloraxis_showscale=False, margin=dict(t=10),
-        )
-        fig_fur.update_xaxes(tickformat=".0%")
-        st.plotly_chart(fig_fur, use_container_width=True)
+        st.plotly_chart(favorite_rate_figure(cache_version, fur), use_container_width=True)
 
     # ── Herd Mentality ──────────────────────────────────────────────────────
     hm = c["herd"]
@@ -418,17 +535,7 @@ with tab2:
             f"It didn't really work out this season but it's definitely how to separate yourself from the pack."
         )
     with chart_col:
-        fig_hm = px.bar(
-            hm, y="player", x="herd_rate", orientation="h",
-            labels={"herd_rate": "% With Majority", "player": ""},
-            color="herd_rate", color_continuous_scale="Purples",
-        )
-        fig_hm.update_layout(
-            height=500, yaxis=dict(autorange="reversed"),
-            coloraxis_showscale=False, margin=dict(t=10),
-        )
-        fig_hm.update_xaxes(tickformat=".0%")
-        st.plotly_chart(fig_hm, use_container_width=True)
+        st.plotly_chart(herd_figure(cache_version, hm), use_container_width=True)
 
     # ── Picks Above Average (PAA) ──────────────────────────────────────────
     st.subheader("Picks Above Average (PAA)")
@@ -460,13 +567,7 @@ with tab2:
         st.markdown("**Biggest Haters (Bottom 5 PAA)**")
         st.dataframe(bot5_paa, use_container_width=True, hide_index=True)
 
-    fig_paa = px.imshow(
-        paa.values, x=paa.columns.tolist(), y=paa.index.tolist(),
-        color_continuous_scale="RdYlGn", aspect="auto",
-        labels=dict(color="PAA"),
-    )
-    fig_paa.update_layout(height=500)
-    st.plotly_chart(fig_paa, use_container_width=True)
+    st.plotly_chart(paa_figure(cache_version, paa), use_container_width=True)
 
     # ── Leaderboard Race ────────────────────────────────────────────────────
     wc = c["wc"]
@@ -486,16 +587,7 @@ with tab2:
     )
     # show only the top 5 finishers by default
     top5_players = final_week.sort_values(ascending=False).head(5).index.tolist()
-    fig_wc = go.Figure()
-    for p in PLAYERS:
-        if p in wc.columns:
-            visible = True if p in top5_players else "legendonly"
-            fig_wc.add_trace(go.Scatter(x=wc.index, y=wc[p], mode="lines+markers", name=p, visible=visible))
-    fig_wc.update_layout(
-        xaxis_title="Week", yaxis_title="Cumulative Correct Picks",
-        height=500, margin=dict(t=10),
-    )
-    st.plotly_chart(fig_wc, use_container_width=True)
+    st.plotly_chart(leaderboard_figure(cache_version, wc, top5_players), use_container_width=True)
 
     # ── Rolling 3-Week Average ────────────────────────────────────────────
     st.subheader("Rolling 3-Week Average")
@@ -504,18 +596,55 @@ with tab2:
         "This smooths out the week-to-week noise and shows momentum."
     )
     rolling_avg = weekly_scores.rolling(3, min_periods=1).mean()
-    fig_rolling = go.Figure()
-    for p in PLAYERS:
-        if p in rolling_avg.columns:
-            visible = True if p in top5_players else "legendonly"
-            fig_rolling.add_trace(go.Scatter(
-                x=rolling_avg.index, y=rolling_avg[p], mode="lines", name=p, visible=visible,
-            ))
-    fig_rolling.update_layout(
-        xaxis_title="Week", yaxis_title="Avg Correct Picks (3-Week Rolling)",
-        height=500, margin=dict(t=10),
-    )
-    st.plotly_chart(fig_rolling, use_container_width=True)
+    st.plotly_chart(rolling_figure(cache_version, rolling_avg, top5_players), use_container_width=True)
+
+    # ── Any Stretch of the Season ───────────────────────────────────────────
+    if "weeks" not in c:
+        st.info(STALE_CACHE_NOTE.format(section="Any Stretch of the Season"))
+    else:
+        weeks_index = c["weeks"]
+
+        st.subheader("Any Stretch of the Season")
+        first_week, last_week = st.slider(
+            "Weeks", weeks_index.first_week, weeks_index.last_week,
+            (weeks_index.first_week, weeks_index.last_week),
+        )
+        st.caption("Records for just the weeks you pick, straight from precomputed running totals.")
+        range_players, range_teams = st.columns(2)
+        with range_players:
+            st.markdown("**Managers**")
+            st.dataframe(weeks_index.player_table(first_week, last_week), use_container_width=True, hide_index=True)
+        with range_teams:
+            st.markdown("**Teams ATS**")
+            team_range = weeks_index.team_table(first_week, last_week)
+            st.dataframe(
+                team_range[["team", "games", "ats_wins", "ats_pushes", "ats_pct", "ml_wins", "ml_pct"]],
+                use_container_width=True, hide_index=True,
+            )
+
+    # ── Half-Point Hooks ────────────────────────────────────────────────────
+    if "what_if" not in c:
+        st.info(STALE_CACHE_NOTE.format(section="Half-Point Hooks"))
+    else:
+        what_if_totals, what_if_ranks = c["what_if"]
+
+        st.subheader("Half-Point Hooks")
+        shift = st.select_slider(
+            "Move every home line by", options=what_if_totals.columns.tolist(), value=0.0,
+            format_func=lambda s: f"{float(s):+g}",
+        )
+        st.caption(
+            "How the standings would look if every spread had been different. "
+            "Positive moves give the home team more points."
+        )
+        hooks = pd.DataFrame({
+            "Actual": what_if_totals[0.0],
+            "What-if": what_if_totals[shift],
+            "Change": what_if_totals[shift] - what_if_totals[0.0],
+            "Actual rank": what_if_ranks[0.0],
+            "What-if rank": what_if_ranks[shift],
+        }).sort_values(["What-if rank", "What-if"], ascending=[True, False])
+        st.dataframe(hooks.reset_index(), use_container_width=True, hide_index=True)
 
     # ── Hot & Cold Streaks ──────────────────────────────────────────────────
     streaks = c["streaks"]
@@ -562,20 +691,39 @@ with tab2:
             f"green = it pays off, red = maybe stop doing that."
         )
     with chart_col:
-        fig_con = px.bar(
-            contrarian_df.head(13), y="player", x="contrarian_rate", orientation="h",
-            color="contrarian_win_rate",
-            color_continuous_scale="RdYlGn",
-            labels={"contrarian_rate": "Contrarian Rate", "contrarian_win_rate": "Win Rate When Contrarian", "player": ""},
-        )
-        fig_con.update_layout(height=450, yaxis=dict(autorange="reversed"), margin=dict(t=10))
-        fig_con.update_xaxes(tickformat=".0%")
-        st.plotly_chart(fig_con, use_container_width=True)
+        st.plotly_chart(contrarian_figure(cache_version, contrarian_df), use_container_width=True)
+
+    # ── Copycats ────────────────────────────────────────────────────────────
+    if "pairs" not in c:
+        st.info(STALE_CACHE_NOTE.format(section="Copycats"))
+    else:
+        pairs = c["pairs"]
+
+        prose_col, chart_col = st.columns([1, 2])
+        with prose_col:
+            st.subheader("Copycats")
+            twins = pairs.iloc[0]
+            opposites = pairs.iloc[-1]
+            st.markdown(
+                f"Which two managers think most alike? Over the games both picked, "
+                f"**{twins['player_a']}** and **{twins['player_b']}** took the same side "
+                f"**{twins['agree_rate']:.0%}** of the time.\n\n"
+                f"At the other end, **{opposites['player_a']}** and **{opposites['player_b']}** "
+                f"agreed on just **{opposites['agree_rate']:.0%}** of their games.\n\n"
+                f"*Both right* counts the games a pair agreed on and both covered."
+            )
+        with chart_col:
+            st.dataframe(
+                pairs[["player_a", "player_b", "shared_games", "agree_rate", "both_right", "both_right_rate"]].head(10),
+                use_container_width=True, hide_index=True,
+            )
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # TAB 3: ML PICK PREDICTOR
 # ═══════════════════════════════════════════════════════════════════════════════
-with tab3:
+@st.fragment
+def pick_predictor():
+    # a fragment: predictor clicks rerun only this function, not every tab
     st.header("Pick Predictor")
     st.caption(
         "Pick your name, generate a game, and see if the ML model can predict your pick."
@@ -621,12 +769,18 @@ with tab3:
 
             # compute model confidence up front
             model = models[selected_player]
-            prob_home = predict_pick(
-                model, feature_names,
-                home_team=s["home"], away_team=s["away"], spread=s["spread"],
-                week=s["week"], indoor=s["indoor"], temp=65,
-                wind=s["wind"], rain_snow=s["rain_snow"], cross_conf=s["cross_conf"],
-            )
+            if lookup is not None:
+                prob_home = lookup.prob_home(
+                    selected_player, s["home"], s["away"], s["spread"], s["week"],
+                    indoor=s["indoor"], wind=s["wind"], rain_snow=s["rain_snow"],
+                )
+            else:
+                prob_home = predict_pick(
+                    model, feature_names,
+                    home_team=s["home"], away_team=s["away"], spread=s["spread"],
+                    week=s["week"], indoor=s["indoor"], temp=65,
+                    wind=s["wind"], rain_snow=s["rain_snow"], cross_conf=s["cross_conf"],
+                )
             prob_away = 1 - prob_home
             model_pick = s["home"] if prob_home >= 0.5 else s["away"]
             model_conf = max(prob_home, prob_away)
@@ -661,7 +815,11 @@ with tab3:
                         st.session_state.predictor_correct += 1
                     # generate new game and rerun
                     st.session_state.pop("scenario", None)
-                    st.rerun()
+                    try:
+                        st.rerun(scope="fragment")
+                    except StreamlitAPIException:
+                        # a click handled during a full-app run can't rerun just the fragment
+                        st.rerun()
 
             with divider_col:
                 st.markdown(
@@ -695,17 +853,19 @@ with tab3:
 
                 # ── Why the model thinks this ─────────────────────
                 st.markdown("**Why the model thinks this:**")
-                feat_row = {name: 0 for name in feature_names}
-                feat_row["spread"] = s["spread"]
-                feat_row["spread_abs"] = abs(s["spread"])
-                feat_row["week"] = s["week"]
-                feat_row[f"home_{s['home']}"] = 1
-                feat_row[f"away_{s['away']}"] = 1
-                feat_row["cross_conference"] = int(s["cross_conf"])
-                feat_row["indoor"] = int(s["indoor"])
-                feat_row["temp"] = 65
-                feat_row["wind"] = s["wind"]
-                feat_row["rain_snow"] = int(s["rain_snow"])
+                if lookup is not None:
+                    factors = lookup.contributions(
+                        selected_player, s["home"], s["away"], s["spread"], s["week"],
+                        indoor=s["indoor"], wind=s["wind"], rain_snow=s["rain_snow"], cross_conf=s["cross_conf"],
+                    )
+                else:
+                    encoder = get_encoder(feature_names)
+                    x = encoder.encode(
+                        s["home"], s["away"], s["spread"], s["week"], indoor=s["indoor"], temp=65,
+                        wind=s["wind"], rain_snow=s["rain_snow"], cross_conf=s["cross_conf"],
+                    )
+                    contribs = encoder.contributions(model.coef_[0], x)
+                    factors = [(feature_names[i], x[i], contribs[i]) for i in np.flatnonzero(x)]
 
                 # get PAA for this player's team preferences
                 player_paa = c["paa"]
@@ -713,11 +873,8 @@ with tab3:
                 if selected_player in player_paa.index:
                     player_paa_row = player_paa.loc[selected_player].to_dict()
 
-                coefs = model.coef_[0]
                 contributions = []
-                for i, fname in enumerate(feature_names):
-                    val = feat_row[fname]
-                    contrib = coefs[i] * val
+                for fname, val, contrib in factors:
                     if abs(contrib) > 0.01:
                         if fname.startswith("home_"):
                             team_id = fname[5:]
@@ -756,3 +913,15 @@ with tab3:
                     direction = "toward home" if contrib > 0 else "toward away"
                     reasons.append(f"- {label} pushes {direction}")
                 st.markdown("\n".join(reasons))
+
+with tab3, section("app.tab3"):
+    pick_predictor()
+
+# ── Profiling panel (RYP_PROFILE=1) ─────────────────────────────────────────
+if profiling.ENABLED:
+    with st.expander("Profiling"):
+        # totals accumulate across reruns; tab 3 fragment reruns show up on the next full run
+        prof = pd.DataFrame.from_dict(profiling.report(), orient="index")
+        st.dataframe(prof.round(4), use_container_width=True)
+        if st.button("Write profile_report.json"):
+            st.caption(f"Wrote {profiling.dump_report()}")
@@ -0,0 +1,151 @@
+"""
+Benchmark data_prep and ml_model on synthetic leagues (see synthetic.py).
+Run: python bench.py [--scales small medium] [--repeat 3] [--compare]
+
+Every timing is appended to bench_results.jsonl tagged with the git commit,
+so runs from different versions can be compared with --compare.
+"""
+import argparse
+import contextlib
+import io
+import json
+import platform
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import data_prep as dp
+import ml_model as mm
+from synthetic import make_league, player_names
+
+RESULTS_PATH = "bench_results.jsonl"
+
+SCALES = {
+    "small": dict(players=13, seasons=1, weeks=18, games_per_week=16),
+    "medium": dict(players=50, seasons=3, weeks=18, games_per_week=16),
+    "large": dict(players=200, seasons=5, weeks=18, games_per_week=16),
+}
+
+# name -> fn(league) where league holds sap, picks, teams_df, players, weekly, facts, pm and models
+STATS = {
+    "pick_facts": lambda lg: dp.pick_facts(lg["picks"], lg["sap"]),
+    "team_stats": lambda lg: dp.team_stats(lg["sap"]),
+    "spread_impact": lambda lg: dp.spread_impact(lg["sap"]),
+    "weekly_surprise": lambda lg: dp.weekly_surprise(lg["sap"]),
+    "pick_matrix": lambda lg: dp.PickMatrix.from_frames(lg["picks"], lg["sap"]),
+    "most_picked_teams": lambda lg: dp.most_picked_teams(lg["pm"]),
+    "player_fav_underdog_rate": lambda lg: dp.player_fav_underdog_rate(lg["pm"]),
+    "paa_heatmap": lambda lg: dp.paa_heatmap(lg["pm"]),
+    "weekly_cumulative": lambda lg: dp.weekly_cumulative(lg["sap"], lg["players"]),
+    "hot_cold_streaks": lambda lg: dp.hot_cold_streaks(lg["sap"], lg["players"]),
+    "streak_windows": lambda lg: dp.streak_windows(lg["weekly"]),
+    # runs of at-least-average weeks
+    "longest_runs": lambda lg: dp.longest_runs(lg["weekly"], lg["weekly"].to_numpy().mean()),
+    "game_consensus": lambda lg: dp.game_consensus(lg["facts"]),
+    "consensus_contrarian": lambda lg: dp.consensus_contrarian(lg["facts"]),
+    "herd_mentality": lambda lg: dp.herd_mentality(lg["facts"]),
+    "agreement_matrix": lambda lg: dp.agreement_matrix(lg["pm"]),
+    "pair_agreement": lambda lg: dp.pair_agreement(lg["pm"]),
+    "week_range_index": lambda lg: dp.week_range_index(lg["sap"], lg["facts"]),
+    "spread_what_if": lambda lg: dp.spread_what_if(lg["pm"]),
+    "build_features": lambda lg: mm.build_features(lg["picks"], lg["sap"], lg["teams_df"], facts=lg["facts"]),
+}
+
+PREDICT_CALLS = 1000
+
+
+def _commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _time(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return min(times), sum(times) / len(times)
+
+
+def _predict_calls(lg):
+    rng = np.random.default_rng(1)
+    model = next(iter(lg["models"].values()))
+    teams = rng.choice(mm.ALL_TEAMS, (PREDICT_CALLS, 2))
+    spreads = rng.choice(mm.LOOKUP_SPREADS, PREDICT_CALLS)
+    weeks = rng.integers(1, 19, PREDICT_CALLS)
+
+    def run():
+        for (home, away), spread, week in zip(teams, spreads, weeks):
+            mm.predict_pick(model, lg["feature_names"], home, away, spread, week)
+    return run
+
+
+def run_scale(scale, repeat=3, workers=None, seed=0):
+    """Time every benchmark at one scale; returns a list of result dicts."""
+    config = SCALES[scale]
+    sap, picks, teams_df = make_league(**config, seed=seed)
+    lg = {"sap": sap, "picks": picks, "teams_df": dp.clean_teams(teams_df),
+          "players": player_names(config["players"]), "facts": dp.pick_facts(picks, sap),
+          "weekly": sap.groupby("week")[player_names(config["players"])].sum().sort_index(),
+          "pm": dp.PickMatrix.from_frames(picks, sap)}
+
+    benches = {name: (lambda fn=fn: fn(lg)) for name, fn in STATS.items()}
+    with tempfile.TemporaryDirectory() as tmp:
+        def train():
+            # quiet: train_models prints a summary line per call
+            with contextlib.redirect_stdout(io.StringIO()):
+                lg["models"], lg["feature_names"] = mm.train_models(
+                    picks, sap, lg["teams_df"], path=Path(tmp) / "models.pkl", workers=workers, incremental=False)
+        benches["train_models"] = train
+        benches["predict_pick"] = lambda: _predict_calls(lg)()
+
+        results = []
+        for name, fn in benches.items():
+            best, mean = _time(fn, repeat)
+            results.append({"bench": name, "best_s": best, "mean_s": mean,
+                            "calls": PREDICT_CALLS if name == "predict_pick" else 1})
+            print(f"  {scale:<7} {name:<26} {best:9.4f}s")
+
+    meta = {"time": pd.Timestamp.now().isoformat(timespec="seconds"), "commit": _commit(),
+            "python": platform.python_version(), "scale": scale, **config,
+            "pick_rows": len(picks), "repeat": repeat}
+    return [{**meta, **r} for r in results]
+
+
+def compare(path=RESULTS_PATH):
+    """Best time per benchmark for the two most recent commits in the results file."""
+    df = pd.read_json(path, lines=True)
+    commits = df.drop_duplicates("commit", keep="last")["commit"].tolist()[-2:]
+    df = df[df["commit"].isin(commits)]
+    table = df.pivot_table(index=["scale", "bench"], columns="commit", values="best_s", aggfunc="min")[commits]
+    if len(commits) == 2:
+        table["ratio"] = table[commits[1]] / table[commits[0]]
+    return table
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark data_prep/ml_model on synthetic leagues.")
+    parser.add_argument("--scales", nargs="+", default=["small", "medium"], choices=list(SCALES))
+    parser.add_argument("--repeat", type=int, default=3, help="runs per benchmark (best and mean are kept)")
+    parser.add_argument("--workers", type=int, default=None, help="training processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=RESULTS_PATH, help="JSON-lines file results are appended to")
+    parser.add_argument("--compare", action="store_true", help="only compare the last two commits in --out")
+    args = parser.parse_args()
+
+    if args.compare:
+        print(compare(args.out).to_string(float_format="{:.4f}".format))
+    else:
+        with open(args.out, "a") as f:
+            for scale in args.scales:
+                for row in run_scale(scale, args.repeat, args.workers, args.seed):
+                    f.write(json.dumps(row) + "\n")
+        print(f"Appended results to {args.out}")
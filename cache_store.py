@@ -0,0 +1,113 @@
+"""
+Per-key store for the precomputed dashboard cache, written by data_prep.build_cache.
+
+Layout: <dir>/manifest.json (format version + one entry per key) and one file per
+key. All-numeric DataFrames are saved as .npy and memory-mapped on read; everything
+else is pickled. Keys are loaded on first access, so a process only pays for the
+keys it actually reads.
+"""
+import json
+import os
+import pickle
+from collections.abc import Mapping
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+CACHE_DIR = Path("cache")
+STORE_FORMAT = 1
+
+
+def _is_numeric_frame(value):
+    return (
+        isinstance(value, pd.DataFrame)
+        and value.shape[1] > 0
+        and value.dtypes.nunique() == 1
+        and np.issubdtype(value.dtypes.iloc[0], np.number)
+    )
+
+
+def _replace(path, write):
+    """Write via a temp file + rename, so readers holding a memory map keep the old file."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        write(f)
+    os.replace(tmp, path)
+
+
+def write_store(values, path=CACHE_DIR, keep=()):
+    """Write `values` into the store at `path`.
+
+    Existing entries named in `keep` stay as they are; every other old entry
+    is dropped. JSON-serializable dicts (like the cache's `_meta`) are stored
+    inline in the manifest.
+    """
+    path = Path(path)
+    path.mkdir(exist_ok=True)
+    manifest_path = path / "manifest.json"
+    old = json.loads(manifest_path.read_text())["keys"] if manifest_path.exists() else {}
+    entries = {key: entry for key, entry in old.items() if key in keep}
+
+    for key, value in values.items():
+        if _is_numeric_frame(value):
+            _replace(path / f"{key}.npy", lambda f: np.save(f, value.to_numpy()))
+            _replace(path / f"{key}.axes.pkl", lambda f: pickle.dump((value.index, value.columns), f))
+            entries[key] = {"kind": "npy", "file": f"{key}.npy"}
+        elif isinstance(value, dict) and key.startswith("_"):
+            entries[key] = {"kind": "inline", "value": value}
+        else:
+            _replace(path / f"{key}.pkl", lambda f: pickle.dump(value, f))
+            entries[key] = {"kind": "pickle", "file": f"{key}.pkl"}
+
+    tmp = manifest_path.with_name("manifest.json.tmp")
+    tmp.write_text(json.dumps({"format": STORE_FORMAT, "keys": entries}, indent=1))
+    os.replace(tmp, manifest_path)
+
+    live = {entry["file"] for entry in entries.values() if "file" in entry}
+    live |= {f"{key}.axes.pkl" for key, entry in entries.items() if entry["kind"] == "npy"}
+    for f in path.iterdir():
+        if f.name != "manifest.json" and f.name not in live:
+            f.unlink()
+
+
+class CacheStore(Mapping):
+    """Read-only mapping over a store directory; each key is loaded on first access."""
+
+    def __init__(self, path=CACHE_DIR):
+        self.path = Path(path)
+        manifest = json.loads((self.path / "manifest.json").read_text())
+        if manifest["format"] != STORE_FORMAT:
+            raise ValueError(f"{self.path} is store format {manifest['format']}, expected {STORE_FORMAT}")
+        self._entries = manifest["keys"]
+        self._loaded = {}
+
+    @staticmethod
+    def exists(path=CACHE_DIR):
+        return (Path(path) / "manifest.json").exists()
+
+    def __getitem__(self, key):
+        if key not in self._loaded:
+            entry = self._entries[key]
+            if entry["kind"] == "inline":
+                value = entry["value"]
+            elif entry["kind"] == "npy":
+                values = np.load(self.path / entry["file"], mmap_mode="r")
+                with open(self.path / f"{key}.axes.pkl", "rb") as f:
+                    index, columns = pickle.load(f)
+                value = pd.DataFrame(values, index=index, columns=columns, copy=False)
+            else:
+                with open(self.path / entry["file"], "rb") as f:
+                    value = pickle.load(f)
+            self._loaded[key] = value
+        return self._loaded[key]
+
+    def __contains__(self, key):
+        # Mapping's default would load the key just to test membership
+        return key in self._entries
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
@@ -2,197 +2,492 @@
 Precompute all stats for the RYP dashboard from scores_and_picks.csv + picks.csv.
 Imported by app.py — all functions return DataFrames or dicts.
 """
+import hashlib
+import json
+import time
+from operator import itemgetter
+from pathlib import Path
+
 import pandas as pd
 import numpy as np
 
+from cache_store import CACHE_DIR, CacheStore, write_store
+from dag import run_dag
+from pick_matrix import PickMatrix
+from week_range import WeekRangeIndex, cumulate
+import profiling
+from profiling import profiled
+
 PLAYERS = [
     "ADon", "Exciting Whites", "Kevin", "MC$", "Maye Magic", "P-Otys",
     "Ripw1124", "Vegas", "Willheser", "Yianni", "b_hop", "derelicious", "mrmcwinnerson",
 ]
 
 
-def load_data():
-    sap = pd.read_csv("scores_and_picks.csv")
-    picks = pd.read_csv("picks.csv")
-    teams_df = pd.read_csv("nfl_teams (1).csv")
+INPUT_FILES = {
+    "sap": "scores_and_picks.csv",
+    "picks": "picks.csv",
+    "teams": "nfl_teams (1).csv",
+}
+
+# bump when a stat function changes so build_cache recomputes everything
+CACHE_VERSION = 2
+
+
+@profiled
+def load_data(matrix=False):
+    """Input frames (sap, picks, teams_df); with matrix=True, a PickMatrix of picks is appended."""
+    sap = pd.read_csv(INPUT_FILES["sap"])
+    picks = pd.read_csv(INPUT_FILES["picks"])
+    teams_df = pd.read_csv(INPUT_FILES["teams"])
+    if matrix:
+        return sap, picks, teams_df, PickMatrix.from_frames(picks, sap)
     return sap, picks, teams_df
 
 
+# ── ATS resolution ──────────────────────────────────────────────────────────
+
+# resolve_ats codes
+ATS_HOME, ATS_AWAY, ATS_PUSH = 1, -1, 0
+
+
+def resolve_ats(score_home, score_away, spread):
+    """Vectorized ATS result: ATS_HOME, ATS_AWAY, ATS_PUSH, or NaN if anything is missing.
+
+    `spread` is from the home team's perspective (negative = home favored).
+    Inputs broadcast, so e.g. spread[:, None] + shifts resolves every game
+    under every shift in one call.
+    """
+    margin = np.asarray(score_home, dtype=float) - np.asarray(score_away, dtype=float)
+    return np.sign(margin + np.asarray(spread, dtype=float))
+
+
+def ats_winner(df):
+    """Team that covered platform_spread, "PUSH", or None, for each row of a sap-shaped frame."""
+    result = resolve_ats(df["score_home"], df["score_away"], df["platform_spread"])
+    return np.select(
+        [result == ATS_HOME, result == ATS_AWAY, result == ATS_PUSH],
+        [df["team_home"], df["team_away"], "PUSH"],
+        default=None,
+    )
+
+
+# ── Historical seasons ──────────────────────────────────────────────────────
+
+HISTORY_FILE = "spreadspoke_scores.csv"
+HISTORY_DIR = Path("seasons")
+
+
+def build_history(src=HISTORY_FILE, out_dir=HISTORY_DIR):
+    """Parse the spreadspoke history once and write one pickle per season.
+
+    Regular-season games only, with team IDs, a `game` label, integer `week`,
+    and the closing line as a home-perspective `platform_spread` so every
+    sap-based stat works on the result unchanged.
+    """
+    scores = pd.read_csv(src)
+    scores = scores[~scores["schedule_playoff"]].copy()
+
+    teams = clean_teams(pd.read_csv(INPUT_FILES["teams"]))
+    name_to_id = teams.set_index("team_name")["team_id"].to_dict()
+    scores["team_home"] = scores["team_home"].map(name_to_id)
+    scores["team_away"] = scores["team_away"].map(name_to_id)
+    scores["team_favorite_id"] = scores["team_favorite_id"].replace("LVR", "LV")
+    scores["game"] = scores["team_away"] + " @ " + scores["team_home"]
+    scores["week"] = scores["schedule_week"].astype(int)
+
+    # negative = home favored, same convention as the pick platform's spread
+    fav = scores["team_favorite_id"]
+    scores["platform_spread"] = np.select(
+        [fav == scores["team_home"], fav == scores["team_away"], fav == "PICK"],
+        [scores["spread_favorite"], -scores["spread_favorite"], 0.0],
+        default=np.nan,
+    )
+    scores["ats_winner"] = ats_winner(scores)
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(exist_ok=True)
+    for season, df in scores.groupby("schedule_season"):
+        df.reset_index(drop=True).to_pickle(out_dir / f"{season}.pkl")
+    manifest = {"source_hash": file_hash(src), "seasons": sorted(int(s) for s in scores["schedule_season"].unique())}
+    (out_dir / "manifest.json").write_text(json.dumps(manifest))
+
+
+def load_history(first, last=None, src=HISTORY_FILE, history_dir=HISTORY_DIR):
+    """Regular-season games for seasons first..last (inclusive), sap-shaped.
+
+    Only the requested season partitions are read. The partitions are rebuilt
+    from the CSV when it changes.
+    """
+    last = first if last is None else last
+    history_dir = Path(history_dir)
+    manifest = history_dir / "manifest.json"
+    if not manifest.exists() or json.loads(manifest.read_text())["source_hash"] != file_hash(src):
+        build_history(src, history_dir)
+
+    parts = [history_dir / f"{season}.pkl" for season in range(first, last + 1)]
+    frames = [pd.read_pickle(p) for p in parts if p.exists()]
+    if not frames:
+        raise ValueError(f"no seasons between {first} and {last} in {src}")
+    return pd.concat(frames, ignore_index=True)
+
+
 # ── Tab 1: Team Performance ─────────────────────────────────────────────────
 
+def team_games(sap):
+    """Long team-game table: one row per team per game, with a home/away flag."""
+    home = pd.DataFrame({
+        "week": sap["week"], "team": sap["team_home"], "is_home": True,
+        "score_for": sap["score_home"], "score_against": sap["score_away"],
+        "ats_winner": sap["ats_winner"],
+    })
+    away = pd.DataFrame({
+        "week": sap["week"], "team": sap["team_away"], "is_home": False,
+        "score_for": sap["score_away"], "score_against": sap["score_home"],
+        "ats_winner": sap["ats_winner"],
+    })
+    tg = pd.concat([home, away], ignore_index=True).dropna(subset=["team"])
+    tg["covered"] = tg["ats_winner"] == tg["team"]
+    tg["push"] = tg["ats_winner"] == "PUSH"
+    tg["won"] = tg["score_for"] > tg["score_against"]
+    return tg
+
+
+@profiled
+def team_stats(sap):
+    """ATS, moneyline and home/away ATS tables from a single groupby.
+
+    Returns (ats, ml, ha), identical to team_ats_record, team_ml_record and
+    home_away_ats.
+    """
+    by_side = team_games(sap).groupby(["team", "is_home"]).agg(
+        games=("won", "size"),
+        covers=("covered", "sum"),
+        pushes=("push", "sum"),
+        wins=("won", "sum"),
+    )
+    teams = by_side.index.get_level_values("team").unique()
+    home = by_side.xs(True, level="is_home").reindex(teams, fill_value=0)
+    away = by_side.xs(False, level="is_home").reindex(teams, fill_value=0)
+    total = home + away
+
+    ats = pd.DataFrame({
+        "team": teams.values,
+        "ats_wins": total["covers"].values,
+        "ats_losses": (total["games"] - total["covers"] - total["pushes"]).values,
+        "ats_pushes": total["pushes"].values,
+        "ats_games": total["games"].values,
+        "ats_pct": _safe_rate(total["covers"], total["games"]),
+    }).sort_values("ats_pct", ascending=False).reset_index(drop=True)
+
+    ml = pd.DataFrame({
+        "team": teams.values,
+        "ml_wins": total["wins"].values,
+        "ml_losses": (total["games"] - total["wins"]).values,
+        "ml_games": total["games"].values,
+        "ml_pct": _safe_rate(total["wins"], total["games"]),
+    }).sort_values("ml_pct", ascending=False).reset_index(drop=True)
+
+    ha = pd.DataFrame({
+        "team": teams.values,
+        "home_cover_pct": _safe_rate(home["covers"], home["games"]),
+        "away_cover_pct": _safe_rate(away["covers"], away["games"]),
+        "home_games": home["games"].values,
+        "away_games": away["games"].values,
+    })
+    return ats, ml, ha
+
+
+def _safe_rate(num, den):
+    """num / den, with 0 where den is 0."""
+    num, den = np.asarray(num, dtype=float), np.asarray(den, dtype=float)
+    return np.divide(num, den, out=np.zeros_like(num), where=den > 0)
+
+
+@profiled
 def team_ats_record(sap):
     """ATS record for every team (as home + away combined)."""
-    rows = []
-    all_teams = set(sap["team_home"].dropna()) | set(sap["team_away"].dropna())
-    for team in sorted(all_teams):
-        home = sap[sap["team_home"] == team]
-        away = sap[sap["team_away"] == team]
-        covers_home = (home["ats_winner"] == team).sum()
-        covers_away = (away["ats_winner"] == team).sum()
-        games_home = len(home)
-        games_away = len(away)
-        total_covers = covers_home + covers_away
-        total_games = games_home + games_away
-        pushes_home = (home["ats_winner"] == "PUSH").sum()
-        pushes_away = (away["ats_winner"] == "PUSH").sum()
-        rows.append({
-            "team": team,
-            "ats_wins": total_covers,
-            "ats_losses": total_games - total_covers - pushes_home - pushes_away,
-            "ats_pushes": pushes_home + pushes_away,
-            "ats_games": total_games,
-            "ats_pct": total_covers / total_games if total_games else 0,
-        })
-    return pd.DataFrame(rows).sort_values("ats_pct", ascending=False).reset_index(drop=True)
+    return team_stats(sap)[0]
 
 
+@profiled
 def team_ml_record(sap):
     """Straight-up (moneyline) record for every team."""
-    rows = []
-    all_teams = set(sap["team_home"].dropna()) | set(sap["team_away"].dropna())
-    for team in sorted(all_teams):
-        home = sap[sap["team_home"] == team]
-        away = sap[sap["team_away"] == team]
-        wins_home = (home["score_home"] > home["score_away"]).sum()
-        wins_away = (away["score_away"] > away["score_home"]).sum()
-        total_wins = wins_home + wins_away
-        total_games = len(home) + len(away)
-        rows.append({
-            "team": team,
-            "ml_wins": total_wins,
-            "ml_losses": total_games - total_wins,
-            "ml_games": total_games,
-            "ml_pct": total_wins / total_games if total_games else 0,
-        })
-    return pd.DataFrame(rows).sort_values("ml_pct", ascending=False).reset_index(drop=True)
+    return team_stats(sap)[1]
 
 
+@profiled
 def home_away_ats(sap):
     """ATS cover rate split by home vs away for each team."""
-    rows = []
-    all_teams = set(sap["team_home"].dropna()) | set(sap["team_away"].dropna())
-    for team in sorted(all_teams):
-        home = sap[sap["team_home"] == team]
-        away = sap[sap["team_away"] == team]
-        home_covers = (home["ats_winner"] == team).sum()
-        away_covers = (away["ats_winner"] == team).sum()
-        rows.append({
-            "team": team,
-            "home_cover_pct": home_covers / len(home) if len(home) else 0,
-            "away_cover_pct": away_covers / len(away) if len(away) else 0,
-            "home_games": len(home),
-            "away_games": len(away),
-        })
-    return pd.DataFrame(rows)
+    return team_stats(sap)[2]
+
+
+def _favorite_covers(sap):
+    """Games with a spread and a final score, with a fav_covered flag."""
+    df = sap.dropna(subset=["platform_spread", "score_home", "score_away"]).copy()
+    result = resolve_ats(df["score_home"], df["score_away"], df["platform_spread"])
+    # determine favorite: negative spread → home, positive → away
+    fav_side = np.where(df["platform_spread"] < 0, ATS_HOME, ATS_AWAY)
+    df["fav_covered"] = (result == fav_side).astype(int)
+    return df
 
 
+@profiled
 def spread_impact(sap):
     """Favorite ATS cover rate bucketed by spread magnitude."""
-    df = sap.dropna(subset=["platform_spread", "ats_winner"]).copy()
+    df = _favorite_covers(sap)
     df["spread_abs"] = df["platform_spread"].abs()
-    # determine favorite: negative spread → home, positive → away
-    df["favorite"] = np.where(df["platform_spread"] < 0, df["team_home"], df["team_away"])
-    df["fav_covered"] = (df["ats_winner"] == df["favorite"]).astype(int)
-    df["spread_bucket"] = pd.cut(df["spread_abs"], bins=[0, 1, 3, 5, 7, 10, 20], labels=["0.5-1", "1.5-3", "3.5-5", "5.5-7", "7.5-10", "10+"])
+    df["spread_bucket"] = pd.cut(df["spread_abs"], bins=[0, 1, 3, 5, 7, 10, np.inf], labels=["0.5-1", "1.5-3", "3.5-5", "5.5-7", "7.5-10", "10+"])
     return df.groupby("spread_bucket", observed=True).agg(
         fav_cover_rate=("fav_covered", "mean"),
         games=("fav_covered", "count"),
     ).reset_index()
 
 
-def weekly_surprise(sap):
-    """Per-week: what % of favorites covered (lower = more upsets)."""
-    df = sap.dropna(subset=["platform_spread", "ats_winner"]).copy()
-    df["favorite"] = np.where(df["platform_spread"] < 0, df["team_home"], df["team_away"])
-    df["fav_covered"] = (df["ats_winner"] == df["favorite"]).astype(int)
-    return df.groupby("week").agg(
+@profiled
+def weekly_surprise(sap, by_season=False):
+    """Per-week: what % of favorites covered (lower = more upsets).
+
+    With by_season=True, multi-season frames get one row per (season, week)
+    instead of pooling each week number across seasons.
+    """
+    df = _favorite_covers(sap)
+    # pick'em games have no favorite
+    df = df[df["platform_spread"] != 0]
+    keys = ["schedule_season", "week"] if by_season else ["week"]
+    return df.groupby(keys).agg(
         fav_cover_rate=("fav_covered", "mean"),
         games=("fav_covered", "count"),
-    ).reset_index().sort_values("week")
+    ).reset_index().sort_values(keys)
+
+
+# ── Pick facts ──────────────────────────────────────────────────────────────
+
+FACT_GAME_COLUMNS = [
+    "team_home", "team_away", "platform_spread",
+    "weather_temperature", "weather_wind_mph", "weather_humidity", "weather_detail", "ats_winner",
+]
+
+
+@profiled
+def pick_facts(picks, sap):
+    """One row per pick with its game joined on once, shared by the pick-level stats.
+
+    Keeps every picks row in order; in_sap marks the ones whose (week, game)
+    is in sap (game columns are NaN otherwise). Adds favorite, picked_home,
+    picked_fav and correct, plus integer codes: player_code over sorted
+    players, pick/home/away_code over sorted teams (-1 when missing) and
+    game_code over sorted (week, game).
+    """
+    games = sap[["week", "game", *FACT_GAME_COLUMNS]].drop_duplicates(subset=["week", "game"])
+    facts = picks.merge(games, on=["week", "game"], how="left", indicator="in_sap")
+    facts["in_sap"] = facts["in_sap"] == "both"
+
+    facts["favorite"] = np.where(facts["platform_spread"] < 0, facts["team_home"], facts["team_away"])
+    facts["picked_home"] = (facts["pick"] == facts["team_home"]).astype(int)
+    facts["picked_fav"] = (facts["pick"] == facts["favorite"]).astype(int)
+    facts["correct"] = (facts["pick"] == facts["ats_winner"]).astype(int)
+
+    teams = pd.Index(sorted(set(facts["pick"].dropna()) | set(games["team_home"]) | set(games["team_away"])))
+    facts["player_code"] = pd.factorize(facts["player"], sort=True)[0]
+    for col, code in (("pick", "pick_code"), ("team_home", "home_code"), ("team_away", "away_code")):
+        facts[code] = teams.get_indexer(facts[col])
+    facts["game_code"] = facts.groupby(["week", "game"], sort=True).ngroup()
+    return facts
 
 
 # ── Tab 2: Bias & Patterns ──────────────────────────────────────────────────
 
-def most_picked_teams(picks):
+@profiled
+def most_picked_teams(pm):
     """Total picks per team across all players."""
-    return picks.groupby("pick").size().reset_index(name="total_picks").sort_values("total_picks", ascending=False)
+    counts = np.bincount(pm.picks[pm.has_pick], minlength=len(pm.teams))
+    picked = counts > 0
+    totals = pd.Series(counts[picked], index=pd.Index(pm.teams[picked], name="pick"))
+    return totals.reset_index(name="total_picks").sort_values("total_picks", ascending=False)
 
 
-def player_fav_underdog_rate(picks, sap):
+@profiled
+def player_fav_underdog_rate(pm):
     """How often each player picks the favorite vs underdog."""
-    # merge to get which team is the favorite
-    merged = picks.merge(
-        sap[["week", "game", "team_home", "team_away", "platform_spread"]].drop_duplicates(),
-        on=["week", "game"], how="inner",
-    )
-    merged["favorite"] = np.where(merged["platform_spread"] < 0, merged["team_home"], merged["team_away"])
-    merged["picked_fav"] = (merged["pick"] == merged["favorite"]).astype(int)
-    return merged.groupby("player").agg(
-        fav_rate=("picked_fav", "mean"),
-        total=("picked_fav", "count"),
-    ).reset_index().sort_values("fav_rate", ascending=False)
-
-
-def paa_heatmap(picks):
+    games = pm.games
+    favorite = np.where(games["platform_spread"] < 0, games["home_code"], games["away_code"])
+    scored = pm.has_pick & games["in_sap"].to_numpy()
+    fav = (scored & (pm.picks == favorite)).sum(axis=1)
+    total = scored.sum(axis=1)
+    keep = total > 0
+    return pd.DataFrame({
+        "player": pm.players[keep],
+        "fav_rate": fav[keep] / total[keep],
+        "total": total[keep],
+    }).sort_values("fav_rate", ascending=False)
+
+
+@profiled
+def paa_heatmap(pm):
     """Picks Above Average: player × team matrix of pick counts minus league average."""
-    ct = picks.groupby(["player", "pick"]).size().unstack(fill_value=0)
+    n_teams = len(pm.teams)
+    rows, cols = np.nonzero(pm.has_pick)
+    counts = np.bincount(rows * n_teams + pm.picks[rows, cols], minlength=len(pm.players) * n_teams)
+    counts = counts.reshape(len(pm.players), n_teams)
+    players, teams = counts.any(axis=1), counts.any(axis=0)
+    ct = pd.DataFrame(counts[players][:, teams],
+                      index=pd.Index(pm.players[players], name="player"),
+                      columns=pd.Index(pm.teams[teams], name="pick"))
     avg = ct.mean(axis=0)
     return ct.sub(avg)
 
 
-def weekly_cumulative(sap):
+@profiled
+def weekly_cumulative(sap, players=None):
     """Running total of correct ATS picks per player over 18 weeks."""
-    weekly = sap.groupby("week")[PLAYERS].sum()
+    weekly = sap.groupby("week")[players or PLAYERS].sum()
     return weekly.cumsum()
 
 
-def hot_cold_streaks(sap):
-    """Best and worst weekly streaks per player."""
-    weekly = sap.groupby("week")[PLAYERS].sum().sort_index()
-    results = {}
-    for p in PLAYERS:
-        if p not in weekly.columns:
+@profiled
+def streak_windows(weekly, lengths=None):
+    """Best and worst k-week windows for every player and every k in `lengths`.
+
+    `weekly` is a week x player frame of correct picks, sorted by week;
+    `lengths` defaults to 1..n_weeks. All window sums for one k come from a
+    single cumulative sum, and ties go to the earliest window. Returns one row
+    per (k, player) with the start/end week and total of the best and worst
+    window.
+    """
+    values = weekly.to_numpy()
+    weeks = weekly.index.to_numpy()
+    n_weeks, n_players = values.shape
+    csum = np.vstack([np.zeros((1, n_players), dtype=values.dtype), values.cumsum(axis=0)])
+    cols = np.arange(n_players)
+
+    parts = []
+    for k in lengths or range(1, n_weeks + 1):
+        if not 1 <= k <= n_weeks:
             continue
-        scores = weekly[p].values
-        weeks = weekly.index.values
-        # find best and worst consecutive-week windows (size 3)
-        best_sum, best_start = -1, 0
-        worst_sum, worst_start = 999, 0
-        for i in range(len(scores) - 2):
-            s = scores[i] + scores[i + 1] + scores[i + 2]
-            if s > best_sum:
-                best_sum, best_start = s, i
-            if s < worst_sum:
-                worst_sum, worst_start = s, i
-        results[p] = {
-            "best_weeks": f"{weeks[best_start]}-{weeks[best_start+2]}",
+        sums = csum[k:] - csum[:-k]
+        best, worst = sums.argmax(axis=0), sums.argmin(axis=0)
+        parts.append({
+            "k": np.full(n_players, k), "player": weekly.columns.to_numpy(),
+            "best_start": weeks[best], "best_end": weeks[best + k - 1], "best_correct": sums[best, cols],
+            "worst_start": weeks[worst], "worst_end": weeks[worst + k - 1], "worst_correct": sums[worst, cols],
+        })
+    if not parts:
+        return pd.DataFrame(columns=["k", "player", "best_start", "best_end", "best_correct",
+                                     "worst_start", "worst_end", "worst_correct"])
+    return pd.DataFrame({col: np.concatenate([part[col] for part in parts]) for col in parts[0]})
+
+
+@profiled
+def longest_runs(weekly, threshold):
+    """Longest run of consecutive weeks with at least `threshold` correct picks, per player.
+
+    Returns player, run_length and the run's start/end week (the earliest
+    run on ties; NaN weeks when a player never reached the threshold).
+    """
+    hit = weekly.to_numpy() >= threshold
+    weeks = weekly.index.to_numpy()
+    count = hit.cumsum(axis=0)
+    # length of the run ending at each week: hits since the last miss
+    run = count - np.maximum.accumulate(np.where(hit, 0, count), axis=0)
+    end = run.argmax(axis=0)
+    length = run[end, np.arange(run.shape[1])]
+    reached = length > 0
+    # players with no run would index past their run's end, so look up only the reached ones
+    start_week = np.full(len(end), np.nan)
+    end_week = np.full(len(end), np.nan)
+    start_week[reached] = weeks[(end - length + 1)[reached]]
+    end_week[reached] = weeks[end[reached]]
+    return pd.DataFrame({
+        "player": weekly.columns,
+        "run_length": length,
+        "start_week": start_week,
+        "end_week": end_week,
+    })
+
+
+def format_streaks(rows):
+    """hot_cold_streaks frame from (player, best_start, best_end, best_correct,
+    worst_start, worst_end, worst_correct) rows."""
+    results = {}
+    for player, best_start, best_end, best_sum, worst_start, worst_end, worst_sum in rows:
+        results[player] = {
+            "best_weeks": f"{best_start}-{best_end}",
             "best_correct": int(best_sum),
-            "worst_weeks": f"{weeks[worst_start]}-{weeks[worst_start+2]}",
+            "worst_weeks": f"{worst_start}-{worst_end}",
             "worst_correct": int(worst_sum),
         }
     return pd.DataFrame(results).T.reset_index().rename(columns={"index": "player"})
 
 
-def consensus_contrarian(picks, sap):
+@profiled
+def hot_cold_streaks(sap, players=None):
+    """Best and worst weekly streaks per player."""
+    players = players or PLAYERS
+    weekly = sap.groupby("week")[players].sum().sort_index()
+    # best and worst consecutive-week windows (size 3)
+    windows = streak_windows(weekly, lengths=[3])
+    return format_streaks(windows[["player", "best_start", "best_end", "best_correct",
+                                   "worst_start", "worst_end", "worst_correct"]].itertuples(index=False))
+
+
+@profiled
+def game_consensus(facts):
+    """Per-(week, game) consensus index shared by the consensus/herd stats.
+
+    One groupby over the pick facts' codes gives each game's majority pick
+    (ties go to the alphabetically first team), majority_count, total_pickers
+    and a tie flag; ats_winner and in_sap come along from the facts. Sorted by
+    (week, game), with game_code and majority_code for lookups.
+    """
+    game_picks = facts.groupby(["game_code", "pick_code"]).size().reset_index(name="n")
+    total = game_picks.groupby("game_code")["n"].sum()
+
+    picked = game_picks[game_picks["pick_code"] >= 0]
+    idx = picked.groupby("game_code")["n"].idxmax()
+    index = picked.loc[idx].rename(columns={"pick_code": "majority_code", "n": "majority_count"})
+    n_top = (picked["n"] == picked.groupby("game_code")["n"].transform("max")).groupby(picked["game_code"]).sum()
+
+    games = facts.drop_duplicates("game_code").set_index("game_code")
+    teams = facts.drop_duplicates("pick_code").set_index("pick_code")["pick"]
+    codes = index["game_code"]
+    return pd.DataFrame({
+        "week": games["week"].reindex(codes).to_numpy(),
+        "game": games["game"].reindex(codes).to_numpy(),
+        "majority_pick": teams.reindex(index["majority_code"]).to_numpy(),
+        "majority_count": index["majority_count"].to_numpy(),
+        "total_pickers": total.reindex(codes).to_numpy(),
+        "tie": n_top.reindex(codes).to_numpy() > 1,
+        "ats_winner": games["ats_winner"].reindex(codes).to_numpy(),
+        "in_sap": games["in_sap"].reindex(codes).to_numpy(),
+        "game_code": codes.to_numpy(),
+        "majority_code": index["majority_code"].to_numpy(),
+    })
+
+
+def _majority_codes(facts, index):
+    """majority_code of each fact row's game; -2 (matches no pick) where the game has none."""
+    per_game = np.full(int(facts["game_code"].max()) + 1, -2)
+    per_game[index["game_code"].to_numpy()] = index["majority_code"].to_numpy()
+    return per_game[facts["game_code"].to_numpy()]
+
+
+@profiled
+def consensus_contrarian(facts, index=None):
     """For each game, what did the majority pick? How often was the majority right?
     Who goes contrarian most?"""
-    # majority pick per game
-    game_picks = picks.groupby(["week", "game", "pick"]).size().reset_index(name="n")
-    idx = game_picks.groupby(["week", "game"])["n"].idxmax()
-    majority = game_picks.loc[idx, ["week", "game", "pick", "n"]].rename(columns={"pick": "majority_pick", "n": "majority_count"})
-
-    # total pickers per game
-    total_per_game = picks.groupby(["week", "game"]).size().reset_index(name="total_pickers")
-    majority = majority.merge(total_per_game, on=["week", "game"])
-    majority["consensus_pct"] = majority["majority_count"] / majority["total_pickers"]
-
-    # was majority right?
-    majority = majority.merge(sap[["week", "game", "ats_winner"]], on=["week", "game"], how="inner")
+    if index is None:
+        index = game_consensus(facts)
+    majority = index[index["in_sap"]].reset_index(drop=True)
+    majority = majority[["week", "game", "majority_pick", "majority_count", "total_pickers", "ats_winner"]]
+    majority.insert(5, "consensus_pct", majority["majority_count"] / majority["total_pickers"])
     majority["majority_correct"] = (majority["majority_pick"] == majority["ats_winner"]).astype(int)
 
     # contrarian rate per player
-    player_picks = picks.merge(majority[["week", "game", "majority_pick"]], on=["week", "game"])
-    player_picks["is_contrarian"] = (player_picks["pick"] != player_picks["majority_pick"]).astype(int)
+    majority_code = _majority_codes(facts, index)
+    keep = facts["in_sap"].to_numpy() & (majority_code != -2)
+    player_picks = facts.loc[keep, ["player", "correct"]]
+    player_picks["is_contrarian"] = (facts["pick_code"].to_numpy()[keep] != majority_code[keep]).astype(int)
 
     contrarian = player_picks.groupby("player").agg(
         contrarian_rate=("is_contrarian", "mean"),
@@ -201,8 +496,6 @@ def consensus_contrarian(picks, sap):
     ).reset_index().sort_values("contrarian_rate", ascending=False)
 
     # contrarian success rate
-    player_picks = player_picks.merge(sap[["week", "game", "ats_winner"]], on=["week", "game"])
-    player_picks["correct"] = (player_picks["pick"] == player_picks["ats_winner"]).astype(int)
     contrarian_only = player_picks[player_picks["is_contrarian"] == 1]
     contrarian_success = contrarian_only.groupby("player")["correct"].mean().reset_index(name="contrarian_win_rate")
     contrarian = contrarian.merge(contrarian_success, on="player", how="left")
@@ -210,12 +503,236 @@ def consensus_contrarian(picks, sap):
     return majority, contrarian
 
 
-def herd_mentality(picks, sap):
+@profiled
+def herd_mentality(facts, index=None):
     """How often each player agrees with the majority pick."""
-    game_picks = picks.groupby(["week", "game", "pick"]).size().reset_index(name="n")
-    idx = game_picks.groupby(["week", "game"])["n"].idxmax()
-    majority = game_picks.loc[idx, ["week", "game", "pick"]].rename(columns={"pick": "majority_pick"})
-
-    merged = picks.merge(majority, on=["week", "game"])
-    merged["with_herd"] = (merged["pick"] == merged["majority_pick"]).astype(int)
+    if index is None:
+        index = game_consensus(facts)
+    majority_code = _majority_codes(facts, index)
+    keep = majority_code != -2
+    merged = facts.loc[keep, ["player"]]
+    merged["with_herd"] = (facts["pick_code"].to_numpy()[keep] == majority_code[keep]).astype(int)
     return merged.groupby("player")["with_herd"].mean().reset_index(name="herd_rate").sort_values("herd_rate", ascending=False)
+
+
+def _pair_counts(pm):
+    """Player x player counts from one-hot pick matrices: (shared games, same side,
+    shared games with a result, both right)."""
+    games = pm.games
+    has = pm.has_pick
+    home = has & (pm.picks == games["home_code"].to_numpy())
+    away = has & (pm.picks == games["away_code"].to_numpy())
+    scored = has & games["in_sap"].to_numpy()
+    right = has & (pm.picks == games["ats_code"].to_numpy())
+
+    def gram(*onehots):
+        # float32 matmul is exact for counts below 2**24 and runs on BLAS
+        total = sum(m.astype(np.float32) @ m.astype(np.float32).T for m in onehots)
+        return np.rint(total).astype(np.int64)
+
+    return gram(has), gram(home, away), gram(scored), gram(right)
+
+
+@profiled
+def agreement_matrix(pm):
+    """Player x player share of shared games picked the same way (NaN if none shared)."""
+    shared, same, _, _ = _pair_counts(pm)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rate = np.where(shared > 0, same / shared, np.nan)
+    return pd.DataFrame(rate, index=pd.Index(pm.players, name="player"), columns=pm.players)
+
+
+@profiled
+def pair_agreement(pm, min_shared=1):
+    """Every pair of players: how often they picked the same side, and how often
+    they agreed and were both right, over the games both of them picked.
+
+    One row per pair with at least `min_shared` shared games, most alike first.
+    both_right_rate is over shared games that have a result.
+    """
+    shared, same, scored, right = _pair_counts(pm)
+    a, b = np.triu_indices(len(pm.players), k=1)
+    keep = shared[a, b] >= min_shared
+    a, b = a[keep], b[keep]
+    pairs = pd.DataFrame({
+        "player_a": pm.players[a],
+        "player_b": pm.players[b],
+        "shared_games": shared[a, b],
+        "same_side": same[a, b],
+        "scored_games": scored[a, b],
+        "both_right": right[a, b],
+    })
+    pairs.insert(4, "agree_rate", pairs["same_side"] / pairs["shared_games"])
+    pairs["both_right_rate"] = pairs["both_right"] / pairs["scored_games"].where(pairs["scored_games"] > 0)
+    return pairs.sort_values("agree_rate", ascending=False, kind="stable").reset_index(drop=True)
+
+
+@profiled
+def week_range_index(sap, facts):
+    """WeekRangeIndex over every week in sap: per-player correct picks / picks
+    and per-team ATS, moneyline and home/away cover counts."""
+    first, last = int(sap["week"].min()), int(sap["week"].max())
+    n_weeks = last - first + 1
+
+    scored = facts[facts["in_sap"]]
+    players = pd.Index(sorted(facts["player"].unique()))
+    player_prefix = cumulate(
+        scored["week"].to_numpy() - first, players.get_indexer(scored["player"]),
+        np.column_stack([scored["correct"].to_numpy(), np.ones(len(scored), dtype=np.int64)]),
+        n_weeks, len(players),
+    )
+
+    tg = team_games(sap)
+    teams = pd.Index(sorted(tg["team"].unique()))
+    home = tg["is_home"].to_numpy()
+    counts = np.column_stack([
+        np.ones(len(tg), dtype=np.int64), tg["covered"], tg["push"], tg["won"],
+        home, home & tg["covered"], ~home, ~home & tg["covered"],
+    ]).astype(np.int64)
+    team_prefix = cumulate(tg["week"].to_numpy() - first, teams.get_indexer(tg["team"]), counts, n_weeks, len(teams))
+    return WeekRangeIndex(first, players, player_prefix, teams, team_prefix)
+
+
+# spread shifts for spread_what_if, in half points
+WHAT_IF_SHIFTS = np.arange(-3, 3.5, 0.5)
+
+
+@profiled
+def spread_what_if(pm, shifts=WHAT_IF_SHIFTS):
+    """Season totals and ranks if every platform_spread moved by each shift.
+
+    A shift s re-resolves each game against platform_spread + s (home
+    perspective: positive s gives the home side more points). All games and
+    shifts are resolved in one broadcast resolve_ats call, and totals for
+    every player and shift come from two matrix products. Returns (totals,
+    ranks) as player x shift frames; the 0.0 column is the actual standings
+    and ranks are 1 = best, ties sharing the better rank.
+    """
+    games = pm.games
+    shifts = np.asarray(shifts, dtype=float)
+    result = resolve_ats(
+        games["score_home"].to_numpy()[:, None], games["score_away"].to_numpy()[:, None],
+        games["platform_spread"].to_numpy()[:, None] + shifts[None, :],
+    )
+    picked_home = pm.picks == games["home_code"].to_numpy()
+    picked_away = pm.picks == games["away_code"].to_numpy()
+    # float32 products are exact for counts below 2**24
+    totals = (picked_home.astype(np.float32) @ (result == ATS_HOME).astype(np.float32)
+              + picked_away.astype(np.float32) @ (result == ATS_AWAY).astype(np.float32))
+    totals = pd.DataFrame(np.rint(totals).astype(np.int64),
+                          index=pd.Index(pm.players, name="player"), columns=pd.Index(shifts, name="shift"))
+    ranks = totals.rank(ascending=False, method="min").astype(np.int64)
+    return totals, ranks
+
+
+# ── Cache builder ───────────────────────────────────────────────────────────
+
+def clean_teams(teams_df):
+    """Team metadata with LVR -> LV to match the IDs used in the scores."""
+    teams_df = teams_df.copy()
+    teams_df["team_id"] = teams_df["team_id"].replace("LVR", "LV")
+    return teams_df
+
+
+# shared intermediates, computed at most once per build: name -> (inputs, function)
+INTERMEDIATES = {
+    "team_stats": (("sap",), team_stats),
+    "pick_facts": (("picks", "sap"), pick_facts),
+    "game_consensus": (("pick_facts",), game_consensus),
+    "pick_matrix": (("picks", "sap"), PickMatrix.from_frames),
+}
+
+# cache key -> (input frames or intermediates it depends on, function computing it)
+CACHE_KEYS = {
+    "sap": (("sap",), lambda sap: sap),
+    "picks": (("picks",), lambda picks: picks),
+    "teams_df": (("teams",), clean_teams),
+    "ats": (("team_stats",), itemgetter(0)),
+    "ml": (("team_stats",), itemgetter(1)),
+    "ha": (("team_stats",), itemgetter(2)),
+    "si": (("sap",), spread_impact),
+    "ws": (("sap",), weekly_surprise),
+    "mpt": (("pick_matrix",), most_picked_teams),
+    "fur": (("pick_matrix",), player_fav_underdog_rate),
+    "paa": (("pick_matrix",), paa_heatmap),
+    "wc": (("sap",), weekly_cumulative),
+    "streaks": (("sap",), hot_cold_streaks),
+    "consensus": (("pick_facts", "game_consensus"), consensus_contrarian),
+    "herd": (("pick_facts", "game_consensus"), herd_mentality),
+    "pairs": (("pick_matrix",), pair_agreement),
+    "weeks": (("sap", "pick_facts"), week_range_index),
+    "what_if": (("pick_matrix",), spread_what_if),
+}
+
+
+def _raw_inputs(name):
+    """Input files a cache key or intermediate ultimately depends on."""
+    if name in INPUT_FILES:
+        return {name}
+    inputs, _ = INTERMEDIATES[name] if name in INTERMEDIATES else CACHE_KEYS[name]
+    return set().union(*(_raw_inputs(i) for i in inputs))
+
+
+def file_hash(path):
+    """SHA-256 of a file's contents."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+@profiled
+def build_cache(path=CACHE_DIR, force=False, workers=None, pool="process", timings=False):
+    """Write every dashboard key to the per-key cache store at `path`.
+
+    Content hashes of the input CSVs are stored in the store's `_meta`; on the
+    next run only keys whose inputs changed are recomputed and rewritten, the
+    rest are left untouched on disk. Stale keys and the intermediates they need
+    are run through dag.run_dag on `workers` threads or processes (`pool`);
+    timings=True prints per-node timings (they're machine-specific, so they
+    stay out of the committed store).
+    """
+    hashes = {name: file_hash(f) for name, f in INPUT_FILES.items()}
+
+    old = CacheStore(path) if not force and CacheStore.exists(path) else {}
+    meta = old.get("_meta", {})
+    if meta.get("version") != CACHE_VERSION:
+        old = {}
+    changed = {name for name, h in hashes.items() if meta.get("hashes", {}).get(name) != h}
+
+    stale = [key for key in CACHE_KEYS if key not in old or changed & _raw_inputs(key)]
+    if not stale:
+        print(f"{path} is up to date")
+        return old
+
+    t0 = time.perf_counter()
+    frames = dict(zip(("sap", "picks", "teams"), load_data()))
+    computed, node_timings = run_dag({**INTERMEDIATES, **CACHE_KEYS}, frames, stale, workers, pool)
+    # keys named after an input ("sap", "picks") are the input itself
+    results = {**frames, **computed}
+
+    updates = {key: results[key] for key in stale}
+    updates["_meta"] = {"version": CACHE_VERSION, "hashes": hashes}
+
+    write_store(updates, path, keep=[key for key in CACHE_KEYS if key not in stale])
+    print(f"Rebuilt {len(stale)}/{len(CACHE_KEYS)} keys in {time.perf_counter() - t0:.2f}s, saved to {path}")
+    if timings:
+        for name, seconds in sorted(node_timings.items(), key=lambda kv: -kv[1]):
+            print(f"  {name:<16} {seconds:8.4f}s")
+    return CacheStore(path)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Precompute the dashboard stats into the cache store.")
+    parser.add_argument("--force", action="store_true", help="recompute every key")
+    parser.add_argument("--workers", type=int, default=None, help="parallel nodes (default: all cores, 1 = in order)")
+    parser.add_argument("--pool", choices=["process", "thread"], default="process")
+    parser.add_argument("--timings", action="store_true", help="print per-node timings")
+    args = parser.parse_args()
+
+    build_cache(force=args.force, workers=args.workers, pool=args.pool, timings=args.timings)
+    if profiling.ENABLED:
+        print(f"Profile written to {profiling.dump_report()}")
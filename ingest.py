@@ -0,0 +1,130 @@
+"""
+Turn the weekly picks_export*.xlsx files into picks.csv.
+Run: python ingest.py [--workers N]
+
+Workbooks are parsed in a process pool and each parsed file is cached by
+mtime + content hash, so re-running after a new export only parses that file.
+"""
+import argparse
+import glob
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from data_prep import INPUT_FILES, file_hash, load_history
+
+EXPORT_PATTERN = "picks_export*.xlsx"
+INGEST_CACHE = ".ingest_cache.pkl"
+
+
+def parse_export(path):
+    """Long picks frame (player, game, spread, pick, confidence) for one workbook.
+
+    Layout: first column is the player, one column per game; the first row
+    holds the spreads and each cell below looks like "PHI (1)".
+    """
+    raw = pd.read_excel(path, engine="openpyxl")
+    player_col = raw.columns[0]
+    spreads = pd.to_numeric(raw.iloc[0, 1:], errors="coerce")
+
+    # ignore_index=False + stable sort keeps the workbook's player-major order
+    long = raw.iloc[1:].melt(id_vars=player_col, var_name="game", value_name="raw", ignore_index=False)
+    long = long.dropna(subset=["raw"]).sort_index(kind="stable")
+
+    parts = long["raw"].astype(str).str.strip().str.rsplit(" ", n=1, expand=True)
+    if 1 not in parts.columns:
+        parts[1] = None
+    return pd.DataFrame({
+        "player": long[player_col].values,
+        "game": long["game"].values,
+        "spread": long["game"].map(spreads).values,
+        "pick": parts[0].values,
+        "confidence": pd.to_numeric(parts[1].str.strip("()"), errors="coerce").values,
+    })
+
+
+def _load_cache(path):
+    if Path(path).exists():
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    return {}
+
+
+def parse_exports(files, cache_path=INGEST_CACHE, workers=None):
+    """Parsed picks per file, reusing cached results for files that haven't changed."""
+    cache = _load_cache(cache_path)
+    parsed, todo = {}, []
+    for f in files:
+        mtime = os.stat(f).st_mtime_ns
+        entry = cache.get(f)
+        if entry and entry["mtime"] == mtime:
+            parsed[f] = entry["picks"]
+            continue
+        digest = file_hash(f)
+        if entry and entry["hash"] == digest:
+            entry["mtime"] = mtime
+            parsed[f] = entry["picks"]
+            continue
+        todo.append((f, mtime, digest))
+
+    paths = [f for f, _, _ in todo]
+    if len(todo) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(parse_export, paths))
+    else:
+        results = [parse_export(f) for f in paths]
+    for (f, mtime, digest), picks in zip(todo, results):
+        cache[f] = {"mtime": mtime, "hash": digest, "picks": picks}
+        parsed[f] = picks
+
+    cache = {f: entry for f, entry in cache.items() if f in parsed}
+    with open(cache_path, "wb") as f:
+        pickle.dump(cache, f)
+    return parsed, paths
+
+
+def ingest(pattern=EXPORT_PATTERN, out=INPUT_FILES["picks"], season=2025, cache_path=INGEST_CACHE, workers=None):
+    """Parse every export, tag each with its NFL week and write picks.csv.
+
+    Weeks already in `out` keep their order there; new weeks follow in week
+    order, each in its workbook's row order.
+    """
+    files = sorted(glob.glob(pattern))
+    parsed, new_files = parse_exports(files, cache_path, workers)
+
+    # each export's week is the schedule week most of its games belong to
+    game_week = load_history(season).set_index("game")["week"]
+    game_week = game_week[~game_week.index.duplicated()]
+    frames = []
+    for f in files:
+        picks = parsed[f]
+        week = picks["game"].drop_duplicates().map(game_week).mode()
+        if week.empty:
+            raise ValueError(f"{f}: no games match the {season} schedule")
+        frames.append(picks.assign(week=int(week.iloc[0])))
+
+    # keep the existing file's week order (new weeks last, by week) so an unchanged
+    # season rewrites it byte for byte; its hash feeds the cache keys and model fingerprints
+    previous = pd.read_csv(out, usecols=["week"])["week"].unique().tolist() if Path(out).exists() else []
+    rank = {week: i for i, week in enumerate(previous)}
+    frames.sort(key=lambda fr: (rank.get(fr["week"].iat[0], len(rank)), fr["week"].iat[0]))
+
+    picks = pd.concat(frames, ignore_index=True)[["week", "player", "game", "spread", "pick", "confidence"]]
+    picks.to_csv(out, index=False)
+    print(f"Parsed {len(new_files)}/{len(files)} files; wrote {len(picks)} pick rows, "
+          f"{picks['week'].nunique()} weeks, {picks['player'].nunique()} players to {out}")
+    return picks
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build picks.csv from the weekly picks exports.")
+    parser.add_argument("--pattern", default=EXPORT_PATTERN, help="glob for the export workbooks")
+    parser.add_argument("--out", default=INPUT_FILES["picks"], help="output CSV")
+    parser.add_argument("--season", type=int, default=2025, help="season used to match exports to weeks")
+    parser.add_argument("--workers", type=int, default=None, help="parser processes (default: all cores)")
+    parser.add_argument("--cache", default=INGEST_CACHE, help="parsed-file cache")
+    args = parser.parse_args()
+    ingest(args.pattern, args.out, args.season, args.cache, args.workers)
@@ -4,11 +4,18 @@ given game conditions. Used by the Tab 3 predictor in the dashboard.
 """
 import pandas as pd
 import numpy as np
+import copy
+import hashlib
+import os
 import pickle
-from sklearn.linear_model import LogisticRegression
-from sklearn.preprocessing import LabelEncoder
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+import profiling
+from data_prep import clean_teams, pick_facts
+from profiling import profiled
+
 PLAYERS = [
     "ADon", "Exciting Whites", "Kevin", "MC$", "Maye Magic", "P-Otys",
     "Ripw1124", "Vegas", "Willheser", "Yianni", "b_hop", "derelicious", "mrmcwinnerson",
@@ -21,116 +28,458 @@ ALL_TEAMS = [
     "TEN", "WAS",
 ]
 
+MODELS_PATH = Path("models/player_models.pkl")
+ARTIFACT_PATH = Path("models/player_models.npz")
+ARTIFACT_VERSION = 1
+LOOKUP_PATH = Path("models/pick_lookup.npz")
+# the scenario space the Tab 3 predictor samples from
+LOOKUP_SPREADS = np.arange(-10, 10.5, 0.5)
+LOOKUP_WEEKS = np.arange(1, 19)
+# (indoor, rain_snow) — the predictor never generates rain indoors
+LOOKUP_CONDITIONS = [(True, False), (False, False), (False, True)]
+LOOKUP_TEMP = 65
 
-def build_features(picks_df, sap_df, teams_df):
-    """Build feature matrix for ML training.
+# column layout produced by build_features
+FEATURE_NAMES = (
+    ["spread", "spread_abs", "week"]
+    + [f"{side}_{team}" for team in ALL_TEAMS for side in ("home", "away")]
+    + ["cross_conference", "indoor", "temp", "wind", "rain_snow"]
+)
+_SCALAR_FEATURES = ("spread", "spread_abs", "week", "cross_conference", "indoor", "temp", "wind", "rain_snow")
 
-    Each row = one player-game pick. Target = did they pick the home team (1) or away (0).
-    Features: team one-hot encodings, spread, week, conference matchup, weather.
+
+class FeatureEncoder:
+    """Writes game scenarios into feature vectors laid out as `feature_names`.
+
+    Column indices are resolved once; features missing from `feature_names`
+    (and teams outside ALL_TEAMS) are skipped, like the old dict-of-zeros rows.
     """
-    # merge picks with game info from scores
-    game_info = sap_df[[
-        "week", "game", "team_home", "team_away", "platform_spread",
-        "weather_temperature", "weather_wind_mph", "weather_humidity", "weather_detail",
-    ]].drop_duplicates(subset=["week", "game"])
 
-    merged = picks_df.merge(game_info, on=["week", "game"], how="inner")
+    def __init__(self, feature_names):
+        self.feature_names = list(feature_names)
+        idx = {name: i for i, name in enumerate(self.feature_names)}
+        self.n_features = len(self.feature_names)
+        self._cols = {name: idx[name] for name in _SCALAR_FEATURES if name in idx}
+        # team code -> column, with a trailing -1 for unknown teams (code -1)
+        self._home = np.array([idx.get(f"home_{t}", -1) for t in ALL_TEAMS] + [-1])
+        self._away = np.array([idx.get(f"away_{t}", -1) for t in ALL_TEAMS] + [-1])
+        self._team_codes = pd.Index(ALL_TEAMS)
+        self._team_idx = {t: i for i, t in enumerate(ALL_TEAMS)}
+
+    def _scalars(self, spread, week, indoor, temp, wind, rain_snow, cross_conf):
+        return {
+            "spread": spread, "spread_abs": np.abs(spread), "week": week,
+            "cross_conference": cross_conf, "indoor": indoor, "temp": temp,
+            "wind": wind, "rain_snow": rain_snow,
+        }
+
+    def encode(self, home_team, away_team, spread, week, indoor=False, temp=65, wind=5,
+               rain_snow=False, cross_conf=False, out=None):
+        """One scenario as a 1-D feature vector, written into `out` if given."""
+        if out is None:
+            out = np.zeros(self.n_features)
+        else:
+            out[:] = 0
+        for name, val in self._scalars(spread, week, indoor, temp, wind, rain_snow, cross_conf).items():
+            if name in self._cols:
+                out[self._cols[name]] = val
+        for cols, team in ((self._home, home_team), (self._away, away_team)):
+            col = cols[self._team_idx.get(team, -1)]
+            if col >= 0:
+                out[col] = 1
+        return out
+
+    def encode_batch(self, home_teams, away_teams, spreads, weeks, indoor=False, temp=65, wind=5,
+                     rain_snow=False, cross_conf=False, out=None):
+        """Many scenarios as an (n, n_features) matrix; array arguments broadcast."""
+        home, away, spread, week, indoor, temp, wind, rain_snow, cross_conf = np.broadcast_arrays(
+            *(np.atleast_1d(a) for a in (home_teams, away_teams, spreads, weeks, indoor, temp, wind, rain_snow, cross_conf))
+        )
+        n = len(home)
+        if out is None:
+            out = np.zeros((n, self.n_features))
+        else:
+            out[:] = 0
+        for name, val in self._scalars(spread.astype(float), week, indoor, temp, wind, rain_snow, cross_conf).items():
+            if name in self._cols:
+                out[:, self._cols[name]] = val
+        rows = np.arange(n)
+        for cols, teams in ((self._home, home), (self._away, away)):
+            team_cols = cols[self._team_codes.get_indexer(teams)]
+            known = team_cols >= 0
+            out[rows[known], team_cols[known]] = 1
+        return out
+
+    def encode_sparse(self, home_teams, away_teams, spreads, weeks, indoor=False, temp=65, wind=5,
+                      rain_snow=False, cross_conf=False):
+        """Same as encode_batch but as a CSR matrix, built straight from the non-zeros.
+
+        Teams are mapped to their one-hot column through categorical codes, so
+        cost and memory scale with rows × non-zero features, not rows × columns.
+        """
+        home, away, spread, week, indoor, temp, wind, rain_snow, cross_conf = np.broadcast_arrays(
+            *(np.atleast_1d(a) for a in (home_teams, away_teams, spreads, weeks, indoor, temp, wind, rain_snow, cross_conf))
+        )
+        n = len(home)
+        from scipy import sparse
+
+        rows = np.arange(n)
+        row_parts, col_parts, data_parts = [], [], []
+        for name, val in self._scalars(spread.astype(float), week, indoor, temp, wind, rain_snow, cross_conf).items():
+            if name in self._cols:
+                val = np.asarray(val, dtype=float)
+                nz = np.flatnonzero(val)
+                row_parts.append(nz)
+                col_parts.append(np.full(len(nz), self._cols[name]))
+                data_parts.append(val[nz])
+        for cols, teams in ((self._home, home), (self._away, away)):
+            team_cols = cols[pd.Categorical(teams, categories=ALL_TEAMS).codes]
+            known = team_cols >= 0
+            row_parts.append(rows[known])
+            col_parts.append(team_cols[known])
+            data_parts.append(np.ones(known.sum()))
+        return sparse.csr_matrix(
+            (np.concatenate(data_parts), (np.concatenate(row_parts), np.concatenate(col_parts))),
+            shape=(n, self.n_features),
+        )
+
+    def contributions(self, coef, x):
+        """Per-feature contribution coef × x to the logit (x may be a batch)."""
+        return np.asarray(coef) * x
+
+
+@lru_cache(maxsize=8)
+def _encoder(feature_names):
+    return FeatureEncoder(feature_names)
+
+
+def get_encoder(feature_names):
+    """Shared FeatureEncoder for a feature layout."""
+    return _encoder(tuple(feature_names))
 
-    # target: 1 if picked home team, 0 if picked away
-    merged["picked_home"] = (merged["pick"] == merged["team_home"]).astype(int)
+
+@profiled
+def build_features(picks_df, sap_df, teams_df, as_sparse=False, facts=None):
+    """Build feature matrix for ML training.
+
+    Each row = one player-game pick. Target = did they pick the home team (1) or away (0).
+    Features: team one-hot encodings, spread, week, conference matchup, weather,
+    in FEATURE_NAMES order. With as_sparse=True the matrix is a scipy CSR
+    matrix instead of a dense DataFrame. Pass `facts` (data_prep.pick_facts)
+    to reuse an existing join of picks with game info.
+    """
+    if facts is None:
+        facts = pick_facts(picks_df, sap_df)
+    merged = facts[facts["in_sap"]].reset_index(drop=True)
 
     # conference/division info
     team_meta = teams_df[["team_id", "team_conference", "team_division"]].drop_duplicates(subset=["team_id"])
     # keep only current teams (non-null division)
     team_meta = team_meta.dropna(subset=["team_division"])
     conf_map = team_meta.set_index("team_id")["team_conference"].to_dict()
-    div_map = team_meta.set_index("team_id")["team_division"].to_dict()
-
-    # features
-    features = pd.DataFrame()
-    features["spread"] = merged["platform_spread"].fillna(0)
-    features["spread_abs"] = features["spread"].abs()
-    features["week"] = merged["week"]
-
-    # home/away team one-hot
-    for team in ALL_TEAMS:
-        features[f"home_{team}"] = (merged["team_home"] == team).astype(int)
-        features[f"away_{team}"] = (merged["team_away"] == team).astype(int)
 
     # conference matchup
-    merged["home_conf"] = merged["team_home"].map(conf_map)
-    merged["away_conf"] = merged["team_away"].map(conf_map)
-    features["cross_conference"] = (merged["home_conf"] != merged["away_conf"]).astype(int)
+    cross_conf = merged["team_home"].map(conf_map) != merged["team_away"].map(conf_map)
 
     # weather
-    features["indoor"] = merged["weather_detail"].fillna("").str.contains("indoor|retractable", case=False).astype(int)
-    features["temp"] = merged["weather_temperature"].fillna(65)
-    features["wind"] = merged["weather_wind_mph"].fillna(5)
-    features["rain_snow"] = merged["weather_detail"].fillna("").str.contains("rain|snow", case=False).astype(int)
+    detail = merged["weather_detail"].fillna("")
+    spread = merged["platform_spread"].fillna(0)
+    encode = get_encoder(FEATURE_NAMES).encode_sparse if as_sparse else get_encoder(FEATURE_NAMES).encode_batch
+    X = encode(
+        merged["team_home"].to_numpy(), merged["team_away"].to_numpy(),
+        spread.to_numpy(), merged["week"].to_numpy(),
+        indoor=detail.str.contains("indoor|retractable", case=False).to_numpy(),
+        temp=merged["weather_temperature"].fillna(65).to_numpy(),
+        wind=merged["weather_wind_mph"].fillna(5).to_numpy(),
+        rain_snow=detail.str.contains("rain|snow", case=False).to_numpy(),
+        cross_conf=cross_conf.to_numpy(),
+    )
+    features = X if as_sparse else pd.DataFrame(X, columns=FEATURE_NAMES, index=merged.index)
 
     return features, merged["picked_home"], merged["player"]
 
 
-def train_models():
-    """Train a logistic regression model for each player. Returns dict of models."""
-    picks = pd.read_csv("picks.csv")
-    sap = pd.read_csv("scores_and_picks.csv")
-    teams_df = pd.read_csv("nfl_teams (1).csv")
+def _fit_player(X, y, init=None):
+    """Fit one player's model, warm-starting from `init`'s coefficients if given."""
+    # imported here so loading models for the dashboard doesn't pull in sklearn
+    from sklearn.linear_model import LogisticRegression
+
+    if init is None:
+        model = LogisticRegression(max_iter=1000, C=0.5, random_state=42)
+    else:
+        model = copy.deepcopy(init).set_params(warm_start=True)
+    return model.fit(X, y)
+
+
+def _fingerprint(X, y):
+    """Hash of one player's training rows, to tell whether they changed."""
+    h = hashlib.sha256()
+    for arr in (X.data, X.indices, X.indptr, np.asarray(y)):
+        h.update(np.ascontiguousarray(arr).tobytes())
+    return h.hexdigest()
+
 
-    # fix LVR -> LV in teams_df for consistency
-    teams_df["team_id"] = teams_df["team_id"].replace("LVR", "LV")
+@profiled
+def train_models(picks=None, sap=None, teams_df=None, path=MODELS_PATH, workers=None, incremental=True):
+    """Train a logistic regression model for each player. Returns dict of models.
 
-    X_all, y_all, players_col = build_features(picks, sap, teams_df)
-    feature_names = list(X_all.columns)
+    Players are fitted in a process pool (`workers`, default all cores); one
+    worker (or a single-core machine) fits them in order in this process. With
+    incremental=True, players whose training rows are unchanged since the
+    saved models keep their model, and changed players are refit starting
+    from their previous coefficients.
+    """
+    picks = pd.read_csv("picks.csv") if picks is None else picks
+    sap = pd.read_csv("scores_and_picks.csv") if sap is None else sap
+    teams_df = clean_teams(pd.read_csv("nfl_teams (1).csv") if teams_df is None else teams_df)
+
+    X_all, y_all, players_col = build_features(picks, sap, teams_df, as_sparse=True)
+    feature_names = list(FEATURE_NAMES)
 
-    models = {}
-    for player in PLAYERS:
-        mask = players_col == player
-        X_p = X_all[mask]
-        y_p = y_all[mask]
+    previous = {"models": {}, "fingerprints": {}}
+    if incremental and Path(path).exists():
+        with open(path, "rb") as f:
+            saved = pickle.load(f)
+        if saved["feature_names"] == feature_names and "fingerprints" in saved:
+            previous = saved
 
-        if len(X_p) < 20:
+    # group rows by player with one stable sort instead of a mask per player
+    codes, players = pd.factorize(players_col, sort=True)
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(players) + 1))
+    y_all = y_all.to_numpy()
+
+    models, fingerprints, todo = {}, {}, []
+    for i, player in enumerate(players):
+        rows = order[bounds[i]:bounds[i + 1]]
+        if len(rows) < 20:
             continue
+        X_p, y_p = X_all[rows], y_all[rows]
+        fingerprints[player] = _fingerprint(X_p, y_p)
+        if previous["fingerprints"].get(player) == fingerprints[player]:
+            models[player] = previous["models"][player]
+        else:
+            todo.append((player, X_p, y_p, previous["models"].get(player)))
 
-        model = LogisticRegression(max_iter=1000, C=0.5, random_state=42)
-        model.fit(X_p, y_p)
-        models[player] = model
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(todo) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            fitted = list(pool.map(_fit_player, *zip(*(t[1:] for t in todo))))
+    else:
+        fitted = [_fit_player(X_p, y_p, init) for _, X_p, y_p, init in todo]
+    models.update((player, model) for (player, *_), model in zip(todo, fitted))
+    models = {p: models[p] for p in players if p in models}
 
-    # save models and feature names
-    Path("models").mkdir(exist_ok=True)
-    with open("models/player_models.pkl", "wb") as f:
-        pickle.dump({"models": models, "feature_names": feature_names}, f)
+    # save models, feature names and per-player data fingerprints
+    Path(path).parent.mkdir(exist_ok=True)
+    with open(path, "wb") as f:
+        pickle.dump({"models": models, "feature_names": feature_names, "fingerprints": fingerprints}, f)
 
-    print(f"Trained {len(models)} player models, saved to models/player_models.pkl")
+    save_artifact(models, feature_names, Path(path).with_suffix(".npz"))
+
+    warm = sum(init is not None for *_, init in todo)
+    print(f"Trained {len(todo)}/{len(models)} player models ({warm} warm-started), saved to {path}")
     return models, feature_names
 
 
+class LinearPickModel:
+    """A fitted player model reduced to its coefficients (sklearn-free)."""
+
+    classes_ = np.array([0, 1])
+
+    def __init__(self, coef, intercept):
+        self.coef_ = np.asarray(coef, dtype=float).reshape(1, -1)
+        self.intercept_ = np.array([intercept], dtype=float)
+
+    def predict_proba(self, X):
+        prob_home = 1 / (1 + np.exp(-(np.asarray(X, dtype=float) @ self.coef_[0] + self.intercept_[0])))
+        return np.column_stack([1 - prob_home, prob_home])
+
+
+def save_artifact(models, feature_names, path=ARTIFACT_PATH):
+    """Write the versioned .npz model artifact: coefficient matrix, intercepts, players, feature names."""
+    players = list(models)
+    np.savez(
+        path,
+        version=ARTIFACT_VERSION,
+        players=np.array(players, dtype=str),
+        feature_names=np.array(feature_names, dtype=str),
+        coef=np.vstack([models[p].coef_[0] for p in players]) if players else np.zeros((0, len(feature_names))),
+        intercept=np.array([models[p].intercept_[0] for p in players], dtype=float),
+    )
+
+
+def load_artifact(path=ARTIFACT_PATH):
+    """Load the .npz artifact with NumPy only. Returns (models, feature_names)."""
+    with np.load(path, allow_pickle=False) as data:
+        if int(data["version"]) != ARTIFACT_VERSION:
+            raise ValueError(f"{path} is artifact version {int(data['version'])}, expected {ARTIFACT_VERSION}")
+        models = {
+            player: LinearPickModel(coef, intercept)
+            for player, coef, intercept in zip(data["players"].tolist(), data["coef"], data["intercept"])
+        }
+        return models, data["feature_names"].tolist()
+
+
+@profiled
 def load_models():
-    """Load pre-trained models."""
-    with open("models/player_models.pkl", "rb") as f:
+    """Load pre-trained models, from the .npz artifact if present, else the pickle."""
+    if ARTIFACT_PATH.exists():
+        try:
+            return load_artifact(ARTIFACT_PATH)
+        except (ValueError, KeyError):
+            pass
+    with open(MODELS_PATH, "rb") as f:
         data = pickle.load(f)
     return data["models"], data["feature_names"]
 
 
+@profiled
 def predict_pick(model, feature_names, home_team, away_team, spread, week,
                  indoor=False, temp=65, wind=5, rain_snow=False, cross_conf=False):
     """Predict probability a player picks the home team."""
-    row = {name: 0 for name in feature_names}
-    row["spread"] = spread
-    row["spread_abs"] = abs(spread)
-    row["week"] = week
-    row[f"home_{home_team}"] = 1
-    row[f"away_{away_team}"] = 1
-    row["cross_conference"] = int(cross_conf)
-    row["indoor"] = int(indoor)
-    row["temp"] = temp
-    row["wind"] = wind
-    row["rain_snow"] = int(rain_snow)
-
-    X = pd.DataFrame([row])[feature_names]
-    prob_home = model.predict_proba(X)[0][1]
-    return prob_home
+    x = get_encoder(feature_names).encode(
+        home_team, away_team, spread, week, indoor=indoor, temp=temp, wind=wind,
+        rain_snow=rain_snow, cross_conf=cross_conf,
+    )
+    return 1 / (1 + np.exp(-(x @ model.coef_[0] + model.intercept_[0])))
+
+
+@profiled
+def predict_pick_batch(models, feature_names, home_teams, away_teams, spreads, weeks,
+                       indoor=False, temp=65, wind=5, rain_snow=False, cross_conf=False):
+    """Probability of picking the home team for a whole slate of games.
+
+    Game arguments are arrays (scalars broadcast). `models` is a single model,
+    giving shape (n_games,), or a dict of player -> model, giving an
+    (n_players, n_games) matrix in the dict's order. Same numbers as
+    predict_pick, computed straight from coef_/intercept_.
+    """
+    single = not isinstance(models, dict)
+    model_list = [models] if single else list(models.values())
+    X = get_encoder(feature_names).encode_batch(
+        home_teams, away_teams, spreads, weeks, indoor=indoor, temp=temp, wind=wind,
+        rain_snow=rain_snow, cross_conf=cross_conf,
+    )
+
+    coef = np.vstack([m.coef_[0] for m in model_list])
+    intercept = np.array([m.intercept_[0] for m in model_list])
+    prob_home = 1 / (1 + np.exp(-(coef @ X.T + intercept[:, None])))
+    return prob_home[0] if single else prob_home
+
+
+@profiled
+def build_lookup(models, feature_names, teams_df, path=LOOKUP_PATH):
+    """Precompute every player's home-pick logit terms over the predictor's scenario space.
+
+    The logit is a sum of independent per-input terms, so each axis gets its
+    own float32 table (player × home team, away team, home/away conference
+    pairing, spread, week, condition, plus the constant and wind terms) and
+    PickLookup adds one entry from each. Saved with the coefficients they
+    came from so the app can tell when the models have moved on.
+    """
+    players = list(models)
+    team_meta = clean_teams(teams_df).dropna(subset=["team_division"]).drop_duplicates(subset=["team_id"])
+    conf_map = team_meta.set_index("team_id")["team_conference"].to_dict()
+    conf = np.array([conf_map.get(t, "NFC") for t in ALL_TEAMS])
+    cross = (conf[:, None] != conf[None, :]).astype(float)
+
+    idx = {name: i for i, name in enumerate(feature_names)}
+    coef = np.vstack([models[p].coef_[0] for p in players]) if players else np.zeros((0, len(feature_names)))
+    intercept = np.array([models[p].intercept_[0] for p in players], dtype=float)
+    w = lambda name: coef[:, idx[name]] if name in idx else np.zeros(len(players))
+    cols = lambda names: coef[:, [idx.get(n, -1) for n in names]] * np.array([n in idx for n in names])
+    indoor = np.array([c[0] for c in LOOKUP_CONDITIONS], dtype=float)
+    rain_snow = np.array([c[1] for c in LOOKUP_CONDITIONS], dtype=float)
+
+    tables = {
+        "base": intercept + w("temp") * LOOKUP_TEMP,
+        "home": cols([f"home_{t}" for t in ALL_TEAMS]),
+        "away": cols([f"away_{t}" for t in ALL_TEAMS]),
+        "pairing": w("cross_conference")[:, None, None] * cross,
+        "spread": w("spread")[:, None] * LOOKUP_SPREADS + w("spread_abs")[:, None] * np.abs(LOOKUP_SPREADS),
+        "week": w("week")[:, None] * LOOKUP_WEEKS,
+        "condition": w("indoor")[:, None] * indoor + w("rain_snow")[:, None] * rain_snow,
+        "wind": w("wind"),
+    }
+    Path(path).parent.mkdir(exist_ok=True)
+    np.savez(
+        path,
+        players=np.array(players, dtype=str), teams=np.array(ALL_TEAMS), feature_names=np.array(feature_names),
+        coef=coef, intercept=intercept,
+        **{name: table.astype(np.float32) for name, table in tables.items()},
+    )
+    nbytes = sum(t.size for t in tables.values()) * 4
+    print(f"Saved pick lookup tables for {len(players)} players ({nbytes / 1e3:.0f} kB) to {path}")
+
+
+class PickLookup:
+    """O(1) home-pick probability and factor breakdown from build_lookup's per-axis tables."""
+
+    TABLES = ("base", "home", "away", "pairing", "spread", "week", "condition", "wind")
+
+    def __init__(self, path=LOOKUP_PATH):
+        with np.load(path, allow_pickle=False) as data:
+            self.players = data["players"].tolist()
+            self.feature_names = data["feature_names"].tolist()
+            self.coef = data["coef"]
+            self.intercept = data["intercept"]
+            teams = data["teams"].tolist()
+            for name in self.TABLES:
+                setattr(self, f"_{name}", data[name])
+        self._player = {p: i for i, p in enumerate(self.players)}
+        self._team = {t: i for i, t in enumerate(teams)}
+        self._encoder = get_encoder(self.feature_names)
+        self._row = np.zeros(self._encoder.n_features)
+
+    def matches(self, models, feature_names):
+        """True if the tensor was built from exactly these models."""
+        return (
+            feature_names == self.feature_names
+            and set(models) == set(self.players)
+            and all(
+                np.array_equal(models[p].coef_[0], self.coef[i]) and models[p].intercept_[0] == self.intercept[i]
+                for p, i in self._player.items()
+            )
+        )
+
+    def prob_home(self, player, home_team, away_team, spread, week, indoor=False, wind=5, rain_snow=False):
+        """predict_pick (at temp=65), to float32 precision, for any scenario the predictor generates."""
+        spread_i = int(round((spread - LOOKUP_SPREADS[0]) * 2))
+        week_i = int(week) - LOOKUP_WEEKS[0]
+        if not (0 <= spread_i < len(LOOKUP_SPREADS) and 0 <= week_i < len(LOOKUP_WEEKS)):
+            raise KeyError(f"spread {spread} / week {week} is outside the lookup")
+        cond = LOOKUP_CONDITIONS.index((bool(indoor), bool(rain_snow)))
+        p, home, away = self._player[player], self._team[home_team], self._team[away_team]
+        z = (
+            float(self._base[p]) + float(self._home[p, home]) + float(self._away[p, away])
+            + float(self._pairing[p, home, away]) + float(self._spread[p, spread_i])
+            + float(self._week[p, week_i]) + float(self._condition[p, cond]) + wind * float(self._wind[p])
+        )
+        return 1 / (1 + np.exp(-z))
+
+    def contributions(self, player, home_team, away_team, spread, week,
+                      indoor=False, wind=5, rain_snow=False, cross_conf=False):
+        """(feature, value, contribution) for the features a scenario sets, in feature order."""
+        x = self._encoder.encode(
+            home_team, away_team, spread, week, indoor=indoor, temp=LOOKUP_TEMP, wind=wind,
+            rain_snow=rain_snow, cross_conf=cross_conf, out=self._row,
+        )
+        contrib = self._encoder.contributions(self.coef[self._player[player]], x)
+        return [(self.feature_names[i], x[i], contrib[i]) for i in np.flatnonzero(x)]
 
 
 if __name__ == "__main__":
-    train_models()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Train the per-player pick models.")
+    parser.add_argument("--lookup", action="store_true", help="also precompute the Pick Predictor lookup tensor")
+    parser.add_argument("--full", action="store_true", help="retrain every player from scratch")
+    parser.add_argument("--workers", type=int, default=None, help="training processes (default: all cores)")
+    args = parser.parse_args()
+
+    models, feature_names = train_models(workers=args.workers, incremental=not args.full)
+    if args.lookup:
+        build_lookup(models, feature_names, pd.read_csv("nfl_teams (1).csv"))
+    if profiling.ENABLED:
+        print(f"Profile written to {profiling.dump_report()}")
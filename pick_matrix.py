@@ -0,0 +1,72 @@
+"""
+Compact integer-coded picks: a player x game matrix of picked-team codes.
+
+Players, teams and games are sorted dictionaries (players by name, teams by
+ID, games by (week, game)); the matrix holds each pick's team code, or
+MISSING (-1) where the player didn't pick that game. Spread and confidence
+come as matching player x game arrays (NaN / 0 where missing); confidence
+is also 0 for picks without one, and must otherwise be an integer 1-127.
+Team codes in `games` are -1 where unknown; ats_code is also -1 for pushes.
+"""
+import numpy as np
+import pandas as pd
+
+MISSING = -1
+
+
+class PickMatrix:
+    """Integer-coded picks. Build with PickMatrix.from_frames(picks, sap)."""
+
+    def __init__(self, players, teams, games, picks, spread, confidence):
+        self.players = players        # (P,) player names
+        self.teams = teams            # (T,) team IDs
+        self.games = games            # (G,) frame: week, game, home/away/ats team codes, scores, platform_spread, in_sap
+        self.picks = picks            # (P, G) int8/int16 team codes, MISSING where no pick
+        self.spread = spread          # (P, G) float32
+        self.confidence = confidence  # (P, G) int8
+
+    @classmethod
+    def from_frames(cls, picks, sap):
+        """Code the picks frame; games and teams are the union of picks and sap."""
+        keys = ["week", "game"]
+        games = pd.concat([picks[keys], sap[keys]]).drop_duplicates().sort_values(keys).reset_index(drop=True)
+        game_info = sap[keys + ["team_home", "team_away", "score_home", "score_away", "platform_spread", "ats_winner"]]
+        game_info = game_info.drop_duplicates(subset=keys)
+        games = games.merge(game_info, on=keys, how="left", indicator="in_sap")
+        games["in_sap"] = games["in_sap"] == "both"
+
+        teams = pd.Index(sorted(set(picks["pick"].dropna()) | set(game_info["team_home"]) | set(game_info["team_away"])))
+        players = pd.Index(sorted(picks["player"].unique()))
+        games["home_code"] = teams.get_indexer(games.pop("team_home"))
+        games["away_code"] = teams.get_indexer(games.pop("team_away"))
+        games["ats_code"] = teams.get_indexer(games.pop("ats_winner"))
+        games = games[["week", "game", "home_code", "away_code", "score_home", "score_away",
+                       "platform_spread", "ats_code", "in_sap"]]
+
+        rows = players.get_indexer(picks["player"])
+        cols = pd.MultiIndex.from_frame(games[keys]).get_indexer(pd.MultiIndex.from_frame(picks[keys]))
+        shape = (len(players), len(games))
+        if np.unique(np.ravel_multi_index((rows, cols), shape)).size != len(picks):
+            raise ValueError("picks has more than one row for some (player, week, game)")
+
+        code_dtype = np.int8 if len(teams) <= np.iinfo(np.int8).max else np.int16
+        matrix = np.full(shape, MISSING, dtype=code_dtype)
+        matrix[rows, cols] = teams.get_indexer(picks["pick"])
+        spread = np.full(shape, np.nan, dtype=np.float32)
+        spread[rows, cols] = picks["spread"].to_numpy()
+        # ingest leaves confidence NaN for bare picks; those keep the 0 sentinel
+        conf = picks["confidence"].to_numpy(dtype=float)
+        present = ~np.isnan(conf)
+        if not ((conf[present] >= 1) & (conf[present] <= np.iinfo(np.int8).max) & (conf[present] % 1 == 0)).all():
+            raise ValueError("picks has a non-integer confidence or one outside 1-127")
+        confidence = np.zeros(shape, dtype=np.int8)
+        confidence[rows[present], cols[present]] = conf[present]
+        return cls(players.to_numpy(), teams.to_numpy(), games, matrix, spread, confidence)
+
+    @property
+    def has_pick(self):
+        return self.picks != MISSING
+
+    @property
+    def nbytes(self):
+        return self.picks.nbytes + self.spread.nbytes + self.confidence.nbytes
@@ -0,0 +1,124 @@
+"""
+Opt-in timing for the hot paths in data_prep, ml_model and app.
+Enable with RYP_PROFILE=1, or RYP_PROFILE=mem to also trace memory (read at
+import time).
+
+@profiled records wall time and call count per function, plus peak traced
+memory with RYP_PROFILE=mem; section(name) does the same for a block. With
+profiling off, @profiled returns the function untouched and section() is a
+shared no-op context manager, so the hooks can stay in place.
+
+Peak memory comes from tracemalloc and is the high-water mark above the
+memory allocated when the block started, nested blocks included. tracemalloc
+slows allocation-heavy code down several times over, so wall times recorded
+under RYP_PROFILE=mem are inflated; take timings from a plain RYP_PROFILE=1
+run. tracemalloc is process-wide, so blocks running concurrently in threads
+see each other's allocations; work done in worker processes is not recorded.
+"""
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+ENABLED = os.environ.get("RYP_PROFILE", "") not in ("", "0")
+MEMORY = os.environ.get("RYP_PROFILE", "") == "mem"
+REPORT_PATH = "profile_report.json"
+
+_stats = {}
+_lock = threading.Lock()
+_local = threading.local()
+_noop = nullcontext()
+
+
+def _record(name, seconds, peak_bytes=None):
+    with _lock:
+        s = _stats.setdefault(name, {"calls": 0, "total_s": 0.0, "max_s": 0.0})
+        s["calls"] += 1
+        s["total_s"] += seconds
+        s["max_s"] = max(s["max_s"], seconds)
+        if peak_bytes is not None:
+            s["peak_mb"] = max(s.get("peak_mb", 0.0), peak_bytes / 2**20)
+
+
+@contextmanager
+def _timed(name):
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record(name, time.perf_counter() - t0)
+
+
+@contextmanager
+def _traced(name):
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    stack = _local.__dict__.setdefault("stack", [])
+    current, peak = tracemalloc.get_traced_memory()
+    if stack:
+        # resetting the peak below would lose the enclosing block's high-water mark
+        stack[-1]["peak"] = max(stack[-1]["peak"], peak)
+    tracemalloc.reset_peak()
+    frame = {"start": current, "peak": current}
+    stack.append(frame)
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - t0
+        stack.pop()
+        peak = max(frame["peak"], tracemalloc.get_traced_memory()[1])
+        if stack:
+            stack[-1]["peak"] = max(stack[-1]["peak"], peak)
+        _record(name, elapsed, peak - frame["start"])
+
+
+def section(name):
+    """Context manager timing the enclosed block under `name`."""
+    if not ENABLED:
+        return _noop
+    return _traced(name) if MEMORY else _timed(name)
+
+
+def profiled(func=None, *, name=None):
+    """Decorator timing every call of `func` (as file.qualname unless `name` is given)."""
+    if func is None:
+        return functools.partial(profiled, name=name)
+    if not ENABLED:
+        return func
+    # file stem rather than __module__, so scripts run as __main__ get their real name
+    module = os.path.splitext(os.path.basename(func.__code__.co_filename))[0]
+    label = name or f"{module}.{func.__qualname__}"
+    measure = _traced if MEMORY else _timed
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with measure(label):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def report():
+    """Recorded stats as {name: {calls, total_s, mean_s, max_s[, peak_mb]}}, slowest first."""
+    with _lock:
+        rows = {
+            name: {"calls": s["calls"], "total_s": s["total_s"], "mean_s": s["total_s"] / s["calls"],
+                   "max_s": s["max_s"], **({"peak_mb": s["peak_mb"]} if "peak_mb" in s else {})}
+            for name, s in _stats.items()
+        }
+    return dict(sorted(rows.items(), key=lambda kv: kv[1]["total_s"], reverse=True))
+
+
+def dump_report(path=REPORT_PATH):
+    """Write report() as JSON and return the path."""
+    with open(path, "w") as f:
+        json.dump(report(), f, indent=2)
+    return path
+
+
+def reset():
+    with _lock:
+        _stats.clear()
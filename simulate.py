@@ -0,0 +1,154 @@
+"""
+Monte Carlo league title odds: play out the remaining games many times and
+count how often each player finishes first.
+Run: python simulate.py --game "SEA @ NE" --spread 4.5 [--pick "Yianni=NE"] [--model] [--sims 1000000] [--workers N]
+
+Each simulated game is covered by the home side with a flat probability;
+each player's side is either known (--pick), drawn from their ml_model pick
+probability (--model), or a coin flip. Simulations run in NumPy chunks, and
+optionally across processes with independent SeedSequence streams.
+"""
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_SIMS = 1_000_000
+CHUNK = 100_000
+
+
+def standings_from_cumulative(wc):
+    """Current points per player: the last row of weekly_cumulative."""
+    return wc.iloc[-1]
+
+
+def pick_probabilities(players, remaining, picks=None, models=None, feature_names=None):
+    """(n_players, n_games) probability that each player takes the home side.
+
+    `remaining` has team_home, team_away, spread (home line) and week columns.
+    Players with a model get ml_model.predict_pick_batch probabilities, the
+    rest 0.5; known picks ({player: {game index: team}}) override both.
+    """
+    prob = np.full((len(players), len(remaining)), 0.5)
+    if models:
+        from ml_model import predict_pick_batch
+
+        modeled = [i for i, p in enumerate(players) if p in models]
+        if modeled:
+            prob[modeled] = predict_pick_batch(
+                {players[i]: models[players[i]] for i in modeled}, feature_names,
+                remaining["team_home"].to_numpy(), remaining["team_away"].to_numpy(),
+                remaining["spread"].to_numpy(dtype=float), remaining["week"].to_numpy(),
+            )
+    for player, games in (picks or {}).items():
+        i = list(players).index(player)
+        for g, team in games.items():
+            prob[i, g] = float(team == remaining["team_home"].iloc[g])
+    return prob
+
+
+def _simulate(points, prob, weights, cover_rate, n_sims, chunk, seed):
+    """Counts of outright wins and shared firsts, plus summed title shares, over n_sims."""
+    rng = np.random.default_rng(seed)
+    n_players, n_games = prob.shape
+    uncertain = ((prob > 0) & (prob < 1)).any()
+    outright = np.zeros(n_players, dtype=np.int64)
+    tied = np.zeros(n_players, dtype=np.int64)
+    share = np.zeros(n_players)
+
+    for start in range(0, n_sims, chunk):
+        n = min(chunk, n_sims - start)
+        home_covers = rng.random((n, 1, n_games)) < cover_rate
+        if uncertain:
+            picked_home = rng.random((n, n_players, n_games)) < prob
+        else:
+            picked_home = (prob == 1)[None]
+        totals = points + ((picked_home == home_covers) * weights).sum(axis=2)
+
+        first = totals == totals.max(axis=1, keepdims=True)
+        n_first = first.sum(axis=1, keepdims=True)
+        outright += (first & (n_first == 1)).sum(axis=0)
+        tied += (first & (n_first > 1)).sum(axis=0)
+        share += (first / n_first).sum(axis=0)
+    return outright, tied, share
+
+
+def simulate_title_odds(standings, prob, weights=1, n_sims=DEFAULT_SIMS, cover_rate=0.5,
+                        chunk=CHUNK, seed=None, workers=1):
+    """Title odds per player from `standings` (player -> points) and pick
+    probabilities `prob` (players x remaining games, in standings order).
+
+    `weights` is the points a correct pick is worth (scalar or players x
+    games). Returns one row per player: p_outright (sole first), p_tied
+    (shared first), p_first (either) and title_share (ties split evenly),
+    best odds first.
+    """
+    points = standings.to_numpy(dtype=np.int64)
+    weights = np.broadcast_to(np.asarray(weights, dtype=np.int64), prob.shape)
+    workers = max(1, min(workers, n_sims))
+    seeds = np.random.SeedSequence(seed).spawn(workers)
+    sizes = [n_sims // workers + (i < n_sims % workers) for i in range(workers)]
+    args = [(points, prob, weights, cover_rate, size, chunk, s) for size, s in zip(sizes, seeds)]
+
+    if workers == 1:
+        results = [_simulate(*args[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_simulate, *zip(*args)))
+    outright, tied, share = (sum(parts) for parts in zip(*results))
+
+    return pd.DataFrame({
+        "player": standings.index,
+        "points": points,
+        "p_outright": outright / n_sims,
+        "p_tied": tied / n_sims,
+        "p_first": (outright + tied) / n_sims,
+        "title_share": share / n_sims,
+    }).sort_values("title_share", ascending=False, kind="stable").reset_index(drop=True)
+
+
+if __name__ == "__main__":
+    from data_prep import load_data, weekly_cumulative
+
+    parser = argparse.ArgumentParser(description="Simulate league title odds over the remaining games.")
+    parser.add_argument("--game", action="append", required=True, help='remaining game, "AWAY @ HOME" (repeatable)')
+    parser.add_argument("--spread", action="append", type=float, required=True, help="home line per --game")
+    parser.add_argument("--week", type=int, default=18, help="week fed to the pick models (trained on 1-18)")
+    parser.add_argument("--pick", action="append", default=[], help='known pick, "PLAYER=TEAM" (repeatable)')
+    parser.add_argument("--model", action="store_true", help="draw unknown picks from the ml_model pick probabilities")
+    parser.add_argument("--cover-rate", type=float, default=0.5, help="probability the home side covers")
+    parser.add_argument("--sims", type=int, default=DEFAULT_SIMS)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+    if len(args.spread) != len(args.game):
+        parser.error("give one --spread per --game")
+
+    sides = [g.split(" @ ") for g in args.game]
+    remaining = pd.DataFrame({
+        "team_away": [a for a, _ in sides], "team_home": [h for _, h in sides],
+        "spread": args.spread, "week": args.week,
+    })
+    picks = {}
+    for entry in args.pick:
+        player, team = entry.rsplit("=", 1)
+        games = [g for g, (a, h) in enumerate(sides) if team in (a, h)]
+        if not games:
+            parser.error(f"{team} isn't in any --game")
+        picks.setdefault(player, {})[games[0]] = team
+
+    sap, _, _ = load_data()
+    standings = standings_from_cumulative(weekly_cumulative(sap)).astype(int)
+    unknown = sorted(set(picks) - set(standings.index))
+    if unknown:
+        parser.error(f"unknown --pick player(s): {', '.join(unknown)} (players: {', '.join(standings.index)})")
+    models = feature_names = None
+    if args.model:
+        from ml_model import load_models
+        models, feature_names = load_models()
+    prob = pick_probabilities(list(standings.index), remaining, picks, models, feature_names)
+
+    odds = simulate_title_odds(standings, prob, n_sims=args.sims, cover_rate=args.cover_rate,
+                               seed=args.seed, workers=args.workers)
+    print(odds.to_string(index=False, float_format="{:.4f}".format))
@@ -0,0 +1,126 @@
+"""
+Seeded synthetic league generator for benchmarks and scale tests.
+
+make_league() returns (sap, picks, teams_df) in the same schemas as
+load_data(), at any scale. Seasons are laid end to end: schedule_season and
+schedule_week restart each season, while `week` keeps counting so that
+(week, game) stays a unique key, as it is in the real single-season data.
+"""
+import numpy as np
+import pandas as pd
+
+from data_prep import PLAYERS, ats_winner
+from ml_model import ALL_TEAMS
+
+FIRST_SEASON = 2025
+WEATHER = np.array([None, "rain", "snow", "fog"], dtype=object)
+WEATHER_P = [0.9, 0.06, 0.02, 0.02]
+
+
+def player_names(n):
+    """The real player names first, then player014, player015, ..."""
+    return list(PLAYERS[:n]) + [f"player{i:03d}" for i in range(len(PLAYERS) + 1, n + 1)]
+
+
+def make_teams(n_teams=32):
+    """Teams frame in the nfl_teams CSV schema: the 32 real ids, then T33, T34, ..."""
+    ids = list(ALL_TEAMS[:n_teams]) + [f"T{i}" for i in range(len(ALL_TEAMS) + 1, n_teams + 1)]
+    conf = np.where(np.arange(n_teams) % 2 == 0, "AFC", "NFC")
+    division = [f"{c} {('East', 'North', 'South', 'West')[i // 2 % 4]}" for i, c in enumerate(conf)]
+    return pd.DataFrame({
+        "team_name": [f"{t} Team" for t in ids],
+        "team_name_short": ids,
+        "team_id": ids,
+        "team_id_pfr": ids,
+        "team_conference": conf,
+        "team_division": division,
+        "team_conference_pre2002": conf,
+        "team_division_pre2002": division,
+    })
+
+
+def make_league(players=13, seasons=1, weeks=18, games_per_week=16, seed=0):
+    """Synthetic (sap, picks, teams_df).
+
+    Every player picks every game. Each player has a fixed home lean, favorite
+    lean and per-team preferences, so the pick models have something to learn,
+    and marks their most confident pick of the week with confidence 2.
+    Scores are drawn around the spread, so about half the picks cover.
+    """
+    rng = np.random.default_rng(seed)
+    teams_df = make_teams(max(32, 2 * games_per_week))
+    teams = teams_df["team_id"].to_numpy()
+    indoor_home = rng.random(len(teams)) < 0.3
+    names = player_names(players)
+
+    # schedule: each week pairs up a random subset of teams
+    n_weeks = seasons * weeks
+    n_games = n_weeks * games_per_week
+    order = np.argsort(rng.random((n_weeks, len(teams))), axis=1)[:, :2 * games_per_week]
+    home_i = order[:, 0::2].ravel()
+    away_i = order[:, 1::2].ravel()
+    week = np.repeat(np.arange(1, n_weeks + 1), games_per_week)
+    season = FIRST_SEASON + (week - 1) // weeks
+    schedule_week = (week - 1) % weeks + 1
+    kickoff = pd.to_datetime([f"{s}-09-07" for s in season]) + pd.to_timedelta((schedule_week - 1) * 7, unit="D")
+
+    spread = np.round(rng.normal(0, 6, n_games) * 2) / 2
+    margin = np.round(rng.normal(-spread, 13.5))
+    total = np.round(rng.normal(44, 9, n_games)).clip(min=np.abs(margin) + 3)
+    score_home = np.floor((total + margin) / 2)
+    score_away = score_home - margin
+
+    indoor = indoor_home[home_i]
+    detail = np.where(indoor, "indoor", rng.choice(WEATHER, n_games, p=WEATHER_P))
+    sap = pd.DataFrame({
+        "schedule_date": [f"{d.month}/{d.day}/{d.year}" for d in kickoff],
+        "schedule_season": season,
+        "schedule_week": schedule_week,
+        "schedule_playoff": False,
+        "team_home": teams[home_i],
+        "score_home": score_home,
+        "score_away": score_away,
+        "team_away": teams[away_i],
+        "team_favorite_id": np.where(spread < 0, teams[home_i], np.where(spread > 0, teams[away_i], "PICK")),
+        "spread_favorite": 0.0 - np.abs(spread),
+        "over_under_line": np.round(rng.normal(44, 4, n_games) * 2) / 2,
+        "stadium": [f"{t} Stadium" for t in teams[home_i]],
+        "stadium_neutral": False,
+        "weather_temperature": np.where(indoor, 72.0, np.round(rng.normal(55, 15, n_games))),
+        "weather_wind_mph": np.where(indoor, 0.0, np.round(rng.uniform(0, 20, n_games))),
+        "weather_humidity": np.where(indoor, np.nan, np.round(rng.uniform(30, 90, n_games))),
+        "weather_detail": detail,
+        "game": [f"{a} @ {h}" for a, h in zip(teams[away_i], teams[home_i])],
+        "week": week,
+        "platform_spread": spread,
+    })
+    sap["ats_winner"] = ats_winner(sap)
+
+    # picks: one row per (player, game), player-major within each week like the exports
+    home_lean = rng.normal(0, 0.5, players)
+    fav_lean = rng.normal(0.3, 0.5, players)
+    team_pref = rng.normal(0, 0.3, (players, len(teams)))
+    p_idx = np.tile(np.repeat(np.arange(players), games_per_week), n_weeks)
+    g_idx = (np.arange(n_weeks)[:, None, None] * games_per_week
+             + np.arange(games_per_week)[None, None, :]).repeat(players, axis=1).ravel()
+    logit = (home_lean[p_idx] + fav_lean[p_idx] * -spread[g_idx] / 7
+             + team_pref[p_idx, home_i[g_idx]] - team_pref[p_idx, away_i[g_idx]])
+    pick_home = rng.random(len(logit)) < 1 / (1 + np.exp(-logit))
+    confident = np.abs(logit).reshape(n_weeks * players, games_per_week)
+    confidence = np.ones_like(confident, dtype=np.int64)
+    confidence[np.arange(len(confident)), confident.argmax(axis=1)] = 2
+
+    picks = pd.DataFrame({
+        "week": week[g_idx],
+        "player": np.asarray(names, dtype=object)[p_idx],
+        "game": sap["game"].to_numpy()[g_idx],
+        "spread": spread[g_idx],
+        "pick": np.where(pick_home, teams[home_i[g_idx]], teams[away_i[g_idx]]),
+        "confidence": confidence.ravel(),
+    })
+
+    correct = (picks["pick"].to_numpy() == sap["ats_winner"].to_numpy()[g_idx]).astype(float)
+    grid = np.zeros((n_games, players))
+    grid[g_idx, p_idx] = correct
+    sap = pd.concat([sap, pd.DataFrame(grid, columns=names)], axis=1)
+    return sap, picks, teams_df
@@ -0,0 +1,13 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(autouse=True)
+def repo_cwd(monkeypatch):
+    # the modules read their inputs relative to the repo root
+    monkeypatch.chdir(ROOT)
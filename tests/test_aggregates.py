@@ -0,0 +1,46 @@
+import pandas as pd
+import pytest
+
+import data_prep as dp
+from aggregates import SeasonAggregates
+from pick_matrix import PickMatrix
+
+
+@pytest.fixture(scope="module")
+def season():
+    return pd.read_csv(dp.INPUT_FILES["picks"]), pd.read_csv(dp.INPUT_FILES["sap"])
+
+
+def assert_matches_full_recompute(aggregates, picks, sap):
+    pm = PickMatrix.from_frames(picks, sap)
+    pd.testing.assert_frame_equal(aggregates.weekly_cumulative(), dp.weekly_cumulative(sap), check_dtype=False)
+    pd.testing.assert_frame_equal(aggregates.hot_cold_streaks(), dp.hot_cold_streaks(sap))
+    pd.testing.assert_frame_equal(aggregates.paa_heatmap(), dp.paa_heatmap(pm), check_dtype=False)
+    pd.testing.assert_frame_equal(aggregates.most_picked_teams().reset_index(drop=True),
+                                  dp.most_picked_teams(pm).reset_index(drop=True), check_dtype=False)
+    pd.testing.assert_frame_equal(aggregates.player_fav_underdog_rate().reset_index(drop=True),
+                                  dp.player_fav_underdog_rate(pm).reset_index(drop=True), check_dtype=False)
+
+
+def test_apply_week_matches_full_recompute(season):
+    picks, sap = season
+    aggregates = SeasonAggregates()
+    for week in (1, 2, 3, 4, 5):
+        aggregates.apply_week(picks[picks["week"] == week], sap[sap["week"] == week])
+        assert_matches_full_recompute(aggregates, picks[picks["week"] <= week], sap[sap["week"] <= week])
+
+
+def test_reapplying_latest_week_replaces_it(season):
+    picks, sap = season
+    aggregates = SeasonAggregates.from_season(picks[picks["week"] < 18], sap[sap["week"] < 18])
+    week_picks, week_results = picks[picks["week"] == 18], sap[sap["week"] == 18]
+
+    aggregates.apply_week(week_picks.iloc[:20], week_results.iloc[:0])   # picks in, no results yet
+    aggregates.apply_week(week_picks, week_results.iloc[:5])             # some results
+    assert_matches_full_recompute(aggregates, picks, pd.concat([sap[sap["week"] < 18], week_results.iloc[:5]]))
+    aggregates.apply_week(week_picks, week_results)                      # final
+    assert aggregates.weeks.count(18) == 1
+    assert_matches_full_recompute(aggregates, picks, sap)
+
+    with pytest.raises(ValueError):
+        aggregates.apply_week(picks[picks["week"] == 17], sap[sap["week"] == 17])
@@ -0,0 +1,13 @@
+from streamlit.testing.v1 import AppTest
+
+from conftest import ROOT
+
+
+def test_pick_predictor_click():
+    at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=120).run()
+    assert not at.exception
+
+    pick = next(b for b in at.button if b.label.startswith("Pick "))
+    at = pick.click().run()
+    assert not at.exception
+    assert any(s.value.startswith("Model score: ") and "/1 correct" in s.value for s in at.success)
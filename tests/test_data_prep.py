@@ -0,0 +1,23 @@
+import numpy as np
+import pandas as pd
+
+from data_prep import longest_runs
+
+
+def _weekly(rows, weeks):
+    return pd.DataFrame(rows, index=pd.Index(weeks, name="week"), columns=["a", "b"])
+
+
+def test_longest_runs_single_week_with_a_player_below_threshold():
+    runs = longest_runs(_weekly([[9, 3]], [1]), threshold=8)
+    assert runs["run_length"].tolist() == [1, 0]
+    assert runs.loc[0, ["start_week", "end_week"]].tolist() == [1, 1]
+    assert runs.loc[1, ["start_week", "end_week"]].isna().all()
+
+
+def test_longest_runs_never_reached_and_earliest_tie():
+    runs = longest_runs(_weekly([[9, 1], [2, 1], [9, 1], [9, 1], [2, 1], [9, 1], [9, 1]], [3, 4, 5, 6, 7, 8, 9]),
+                        threshold=8)
+    assert runs.loc[0, ["run_length", "start_week", "end_week"]].tolist() == [2, 5, 6]
+    assert runs.loc[1, "run_length"] == 0
+    assert np.isnan(runs.loc[1, "start_week"]) and np.isnan(runs.loc[1, "end_week"])
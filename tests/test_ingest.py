@@ -0,0 +1,23 @@
+import shutil
+
+import pandas as pd
+
+from data_prep import INPUT_FILES, file_hash
+from ingest import ingest
+
+
+def test_ingest_rewrites_picks_csv_unchanged(tmp_path):
+    out = tmp_path / "picks.csv"
+    shutil.copy(INPUT_FILES["picks"], out)
+    ingest(out=out, cache_path=tmp_path / "ingest_cache.pkl")
+    assert file_hash(out) == file_hash(INPUT_FILES["picks"])
+
+
+def test_ingest_from_scratch_orders_by_week(tmp_path):
+    out = tmp_path / "picks.csv"
+    picks = ingest(out=out, cache_path=tmp_path / "ingest_cache.pkl")
+    assert picks["week"].is_monotonic_increasing
+
+    key = ["week", "player", "game"]
+    expected = pd.read_csv(INPUT_FILES["picks"]).sort_values(key).reset_index(drop=True)
+    pd.testing.assert_frame_equal(pd.read_csv(out).sort_values(key).reset_index(drop=True), expected)
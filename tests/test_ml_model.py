@@ -0,0 +1,31 @@
+import numpy as np
+import pandas as pd
+
+from data_prep import INPUT_FILES, clean_teams
+from ml_model import ALL_TEAMS, LOOKUP_CONDITIONS, LOOKUP_SPREADS, PickLookup, build_lookup, load_models, predict_pick
+
+
+def test_pick_lookup_matches_predict_pick(tmp_path):
+    models, feature_names = load_models()
+    teams_df = pd.read_csv(INPUT_FILES["teams"])
+    build_lookup(models, feature_names, teams_df, path=tmp_path / "lookup.npz")
+    lookup = PickLookup(tmp_path / "lookup.npz")
+    assert lookup.matches(models, feature_names)
+
+    conf = clean_teams(teams_df).drop_duplicates("team_id").set_index("team_id")["team_conference"]
+    rng = np.random.default_rng(0)
+    for _ in range(200):
+        player = rng.choice(list(models))
+        home, away = rng.choice(ALL_TEAMS, 2, replace=False)
+        spread, week = rng.choice(LOOKUP_SPREADS), int(rng.integers(1, 19))
+        indoor, rain_snow = LOOKUP_CONDITIONS[rng.integers(len(LOOKUP_CONDITIONS))]
+        wind = int(rng.integers(0, 26))
+        expected = predict_pick(models[player], feature_names, home, away, spread, week, indoor=indoor,
+                                wind=wind, rain_snow=rain_snow, cross_conf=conf[home] != conf[away])
+        got = lookup.prob_home(player, home, away, spread, week, indoor=indoor, wind=wind, rain_snow=rain_snow)
+        assert abs(got - expected) < 1e-6
+
+    # same-conference game with every optional argument left at its default
+    player = next(iter(models))
+    assert abs(lookup.prob_home(player, "KC", "DEN", -3.0, 5)
+               - predict_pick(models[player], feature_names, "KC", "DEN", -3.0, 5)) < 1e-6
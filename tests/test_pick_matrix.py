@@ -0,0 +1,27 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pick_matrix import PickMatrix
+
+SAP = pd.DataFrame({
+    "week": [1], "game": ["B @ A"], "team_home": ["A"], "team_away": ["B"],
+    "score_home": [20], "score_away": [17], "platform_spread": [-2.5], "ats_winner": ["A"],
+})
+
+
+def _picks(confidence):
+    return pd.DataFrame({"week": [1, 1], "player": ["p", "q"], "game": ["B @ A"] * 2,
+                         "spread": [-2.5, 2.5], "pick": ["A", "B"], "confidence": confidence})
+
+
+def test_missing_confidence_keeps_the_zero_sentinel():
+    pm = PickMatrix.from_frames(_picks([2, np.nan]), SAP)
+    assert pm.confidence[:, 0].tolist() == [2, 0]
+    assert pm.has_pick.all()
+
+
+@pytest.mark.parametrize("bad", [0, 128, 1.5])
+def test_out_of_range_confidence_raises(bad):
+    with pytest.raises(ValueError):
+        PickMatrix.from_frames(_picks([1, bad]), SAP)
@@ -0,0 +1,80 @@
+"""
+Prefix-sum index for "record from week a to week b" queries.
+
+Per-week counts for every player and team are cumulated along the week axis
+once (data_prep.week_range_index builds it), so any inclusive week range is
+one subtraction: O(1) for a single player or team, one vectorized
+subtraction for the whole table.
+"""
+import numpy as np
+import pandas as pd
+
+PLAYER_COUNTS = ["correct", "picks"]
+TEAM_COUNTS = ["games", "ats_wins", "ats_pushes", "ml_wins",
+               "home_games", "home_covers", "away_games", "away_covers"]
+
+
+class WeekRangeIndex:
+    """Cumulative player and team counts over a dense run of weeks.
+
+    player_prefix is (n_weeks + 1, n_players, len(PLAYER_COUNTS)) and
+    team_prefix (n_weeks + 1, n_teams, len(TEAM_COUNTS)); row 0 is zeros and
+    row i holds totals through weeks[i - 1].
+    """
+
+    def __init__(self, first_week, players, player_prefix, teams, team_prefix):
+        self.first_week = first_week
+        self.last_week = first_week + len(player_prefix) - 2
+        self.players = list(players)
+        self.teams = list(teams)
+        self.player_prefix = player_prefix
+        self.team_prefix = team_prefix
+        self._player = {p: i for i, p in enumerate(self.players)}
+        self._team = {t: i for i, t in enumerate(self.teams)}
+
+    def _bounds(self, first, last):
+        """Prefix rows to subtract for weeks first..last (inclusive, clipped to the index)."""
+        lo = min(max(first, self.first_week), self.last_week + 1) - self.first_week
+        hi = min(max(last, self.first_week - 1), self.last_week) - self.first_week + 1
+        return lo, max(hi, lo)
+
+    def _range(self, prefix, first, last):
+        lo, hi = self._bounds(first, last)
+        return prefix[hi] - prefix[lo]
+
+    def player_record(self, player, first, last):
+        """{correct, picks} for one player over weeks first..last."""
+        lo, hi = self._bounds(first, last)
+        i = self._player[player]
+        counts = self.player_prefix[hi, i] - self.player_prefix[lo, i]
+        return dict(zip(PLAYER_COUNTS, counts.tolist()))
+
+    def team_record(self, team, first, last):
+        """Game, ATS, moneyline and home/away cover counts for one team over weeks first..last."""
+        lo, hi = self._bounds(first, last)
+        i = self._team[team]
+        counts = self.team_prefix[hi, i] - self.team_prefix[lo, i]
+        return dict(zip(TEAM_COUNTS, counts.tolist()))
+
+    def player_table(self, first, last):
+        """Every player's correct picks, picks and hit rate over the range, best first."""
+        table = pd.DataFrame(self._range(self.player_prefix, first, last), columns=PLAYER_COUNTS)
+        table.insert(0, "player", self.players)
+        table["pct"] = table["correct"] / table["picks"].where(table["picks"] > 0)
+        return table.sort_values(["correct", "pct"], ascending=False, kind="stable").reset_index(drop=True)
+
+    def team_table(self, first, last):
+        """Every team's counts over the range with ATS and moneyline rates, best ATS first."""
+        table = pd.DataFrame(self._range(self.team_prefix, first, last), columns=TEAM_COUNTS)
+        table.insert(0, "team", self.teams)
+        games = table["games"].where(table["games"] > 0)
+        table["ats_pct"] = table["ats_wins"] / games
+        table["ml_pct"] = table["ml_wins"] / games
+        return table.sort_values("ats_pct", ascending=False, kind="stable").reset_index(drop=True)
+
+
+def cumulate(week_pos, entity, values, n_weeks, n_entities):
+    """Prefix sums of `values` rows scattered by (week position, entity code)."""
+    counts = np.zeros((n_weeks + 1, n_entities, values.shape[1]), dtype=np.int64)
+    np.add.at(counts, (week_pos + 1, entity), values)
+    return counts.cumsum(axis=0)